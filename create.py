@@ -2,99 +2,374 @@
 """
 Simplified LeetCode Problem Creator
 Usage: python create.py 1408
+       python create.py 1 20 26 283
+       python create.py --from-file ids.txt
+       python create.py --refresh-catalog
+       python create.py --refill-tests 26
 """
 
+import os
 import sys
-import subprocess
+import gzip
+import json
+import time
+import hashlib
+import random
+import asyncio
+import functools
 import requests
+from requests.adapters import HTTPAdapter
 import re
 import html
 import ast
-
-
-def get_leetcode_problem_info(problem_id):
-    """Fetch problem information from LeetCode API (including topics)"""
-    
-    # LeetCode GraphQL endpoint
-    graphql_url = "https://leetcode.com/graphql"
-    
-    # Get detailed problem information (including topics)
-    detail_query = """
-    query questionData($titleSlug: String!) {
-        question(titleSlug: $titleSlug) {
-            questionId
-            questionFrontendId
-            title
-            titleSlug
-            difficulty
-            content
-            metaData
-            topicTags {
-                name
-                slug
-            }
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+from lc_utils import load_script
+
+
+PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.path.join(PROJECT_ROOT, '.cache')
+
+# Local ID -> titleSlug catalog, refreshed from the bulk problem list at most once per TTL
+CATALOG_FILE = os.path.join(CACHE_DIR, 'problem-catalog.json')
+CATALOG_TTL = 7 * 24 * 60 * 60  # seconds
+
+# Point LEETCODE_URL at a local stub (scripts/leetcode-stub-server.py) to run fully offline
+LEETCODE_URL = os.environ.get('LEETCODE_URL', 'https://leetcode.com').rstrip('/')
+CATALOG_URL = f"{LEETCODE_URL}/api/problems/all/"
+GRAPHQL_URL = f"{LEETCODE_URL}/graphql"
+
+# Get detailed problem information (including topics)
+QUESTION_QUERY = """
+query questionData($titleSlug: String!) {
+    question(titleSlug: $titleSlug) {
+        questionId
+        questionFrontendId
+        title
+        titleSlug
+        difficulty
+        content
+        metaData
+        topicTags {
+            name
+            slug
         }
     }
-    """
-    
-    try:
-        headers = {
-            'Content-Type': 'application/json',
+}
+"""
+
+# Raw questionData responses, gzip-compressed and keyed by titleSlug, evicted least-recently-used first
+QUESTION_CACHE_DIR = os.path.join(CACHE_DIR, 'questions')
+QUESTION_CACHE_MAX_BYTES = 32 * 1024 * 1024
+
+# Transient statuses worth retrying (rate limited / upstream hiccups)
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+_catalog = None
+_catalog_refreshed = False
+_session = None
+
+
+def get_session():
+    """Return the process-wide HTTP session so every request reuses pooled keep-alive connections"""
+    global _session
+    if _session is None:
+        _session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+        _session.mount('https://', adapter)
+        _session.mount('http://', adapter)
+        _session.headers.update({
             'User-Agent': 'Mozilla/5.0',
             'Referer': 'https://leetcode.com',
+        })
+    return _session
+
+
+def fetch_problem_catalog():
+    """Download the bulk problem list and reduce it to {frontend_id: titleSlug}"""
+    response = get_session().get(CATALOG_URL, timeout=15)
+    response.raise_for_status()
+
+    slugs = {}
+    for entry in response.json().get('stat_status_pairs', []):
+        stat = entry.get('stat', {})
+        frontend_id = stat.get('frontend_question_id') or stat.get('question_id')
+        slug = stat.get('question__title_slug')
+        if frontend_id and slug:
+            slugs[str(frontend_id)] = slug
+    return slugs
+
+
+def _save_problem_catalog(slugs):
+    """Atomically write the catalog file"""
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    tmp_file = CATALOG_FILE + '.tmp'
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump({'fetched_at': time.time(), 'slugs': slugs}, f, separators=(',', ':'))
+    os.replace(tmp_file, CATALOG_FILE)
+
+
+def load_problem_catalog(refresh=False, allow_stale=True):
+    """Return the {frontend_id: titleSlug} catalog, downloading it only when missing, stale or forced
+
+    When the download fails, a cached copy is used instead unless allow_stale is False (an explicit
+    --refresh-catalog), in which case the error is raised.
+    """
+    global _catalog, _catalog_refreshed
+
+    if _catalog is not None and not refresh:
+        return _catalog
+
+    cached = None
+    if os.path.exists(CATALOG_FILE):
+        try:
+            with open(CATALOG_FILE, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            cached = None
+
+    if cached and not refresh and time.time() - cached.get('fetched_at', 0) < CATALOG_TTL:
+        _catalog = cached.get('slugs', {})
+        return _catalog
+
+    # One attempt per process: a failed refresh is not retried on every catalog miss
+    _catalog_refreshed = True
+    try:
+        _catalog = fetch_problem_catalog()
+        _save_problem_catalog(_catalog)
+    except Exception as e:
+        if not cached or not allow_stale:
+            raise
+        # Offline or rate limited: a stale catalog still resolves every known problem
+        print(f"⚠️  Unable to refresh problem catalog, using cached copy: {e}")
+        _catalog = cached.get('slugs', {})
+
+    return _catalog
+
+
+def get_title_slug(problem_id):
+    """Map a frontend problem ID to its titleSlug using the local catalog"""
+    slug = load_problem_catalog().get(str(problem_id))
+    if slug is None and not _catalog_refreshed:
+        # Problem newer than the cached catalog, refresh once and retry
+        slug = load_problem_catalog(refresh=True).get(str(problem_id))
+    return slug
+
+
+def _question_payload(title_slug):
+    """Build the GraphQL request body for one problem's details"""
+    return {
+        "query": QUESTION_QUERY,
+        "variables": {
+            "titleSlug": title_slug
         }
+    }
+
+
+def _parse_question_data(detail_data):
+    """Convert a raw questionData response into the problem info dict"""
+    if 'data' in detail_data and (detail_data['data'] or {}).get('question'):
+        q = detail_data['data']['question']
+        topics = [tag['name'] for tag in q.get('topicTags', [])]
         
-        # Step 1: Find the problem's titleSlug via REST API (more reliable than bulk GraphQL)
-        rest_response = requests.get(
-            "https://leetcode.com/api/problems/all/",
-            headers={'User-Agent': 'Mozilla/5.0'},
-            timeout=15
-        )
-        rest_response.raise_for_status()
-        rest_data = rest_response.json()
-        
-        title_slug = None
-        for entry in rest_data.get('stat_status_pairs', []):
-            stat = entry.get('stat', {})
-            if str(stat.get('question_id', '')) == str(problem_id):
-                title_slug = stat.get('question__title_slug')
-                break
+        return {
+            'id': q['questionFrontendId'],
+            'title': q['title'],
+            'difficulty': q['difficulty'].lower(),
+            'topics': topics,
+            'titleSlug': q['titleSlug'],
+            'content': q.get('content') or '',
+            'metaData': q.get('metaData') or '{}'
+        }
+    
+    return None
+
+
+def _question_cache_path(title_slug):
+    """Cache file for one titleSlug (hashed so any slug maps to a safe file name)"""
+    digest = hashlib.sha256(title_slug.encode('utf-8')).hexdigest()
+    return os.path.join(QUESTION_CACHE_DIR, f"{digest}.json.gz")
+
+
+def load_cached_question(title_slug):
+    """Return the cached raw questionData response for a titleSlug, or None"""
+    path = _question_cache_path(title_slug)
+    try:
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            detail_data = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    # Touch on read so eviction drops the least recently used entries
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+    return detail_data
+
+
+def store_cached_question(title_slug, detail_data, max_bytes=QUESTION_CACHE_MAX_BYTES):
+    """Write a raw questionData response to the cache, then enforce the size cap"""
+    os.makedirs(QUESTION_CACHE_DIR, exist_ok=True)
+    path = _question_cache_path(title_slug)
+    tmp_file = f"{path}.{os.getpid()}.tmp"
+    with gzip.open(tmp_file, 'wt', encoding='utf-8') as f:
+        json.dump(detail_data, f, separators=(',', ':'))
+    os.replace(tmp_file, path)
+    evict_question_cache(max_bytes)
+
+
+def evict_question_cache(max_bytes=QUESTION_CACHE_MAX_BYTES):
+    """Delete least recently used cache entries until the cache fits in max_bytes"""
+    entries = []
+    total = 0
+    with os.scandir(QUESTION_CACHE_DIR) as it:
+        for entry in it:
+            if entry.name.endswith('.json.gz'):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total += stat.st_size
+
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+            total -= size
+        except OSError:
+            pass
+
+
+def _cacheable(detail_data):
+    """Only successful responses are worth caching"""
+    return bool(((detail_data or {}).get('data') or {}).get('question'))
+
+
+def _cache_fetched_question(title_slug, detail_data):
+    """Cache a fresh response; a failed write is only a warning, the fetched data is still used"""
+    if not _cacheable(detail_data):
+        return
+    try:
+        store_cached_question(title_slug, detail_data)
+    except OSError as e:
+        print(f"⚠️  Unable to write question cache: {e}")
+
+
+def get_leetcode_problem_info(problem_id, use_cache=True):
+    """Fetch problem information from LeetCode API (including topics)"""
+    try:
+        # Step 1: Resolve the problem's titleSlug from the local catalog
+        title_slug = get_title_slug(problem_id)
         
         if not title_slug:
             return None
         
-        # Step 2: Get detailed information (including topics)
-        detail_payload = {
-            "query": detail_query,
-            "variables": {
-                "titleSlug": title_slug
-            }
-        }
-        
-        detail_response = requests.post(graphql_url, json=detail_payload, headers=headers, timeout=10)
-        detail_data = detail_response.json()
-        
-        if 'data' in detail_data and 'question' in detail_data['data']:
-            q = detail_data['data']['question']
-            topics = [tag['name'] for tag in q.get('topicTags', [])]
-            
-            return {
-                'id': q['questionFrontendId'],
-                'title': q['title'],
-                'difficulty': q['difficulty'].lower(),
-                'topics': topics,
-                'titleSlug': q['titleSlug'],
-                'content': q.get('content') or '',
-                'metaData': q.get('metaData') or '{}'
-            }
-        
-        return None
+        # Step 2: Get detailed information (including topics), from the local cache when possible
+        detail_data = load_cached_question(title_slug) if use_cache else None
+        if detail_data is None:
+            detail_response = get_session().post(GRAPHQL_URL, json=_question_payload(title_slug), timeout=10)
+            detail_data = detail_response.json()
+            _cache_fetched_question(title_slug, detail_data)
+        return _parse_question_data(detail_data)
         
     except Exception as e:
         print(f"⚠️  Unable to fetch problem information from LeetCode: {e}")
         return None
 
 
+class HostRateLimiter:
+    """Space out requests to the same host by at least 1/rate seconds"""
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate if rate else 0.0
+        self._next_slot = {}
+        self._lock = asyncio.Lock()
+
+    async def wait(self, url):
+        host = urlparse(url).netloc
+        async with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+async def _post_with_retry(executor, limiter, url, payload, retries=3, backoff=0.5):
+    """POST through the pooled session off the event loop, retrying transient failures with backoff"""
+    loop = asyncio.get_running_loop()
+    post = functools.partial(get_session().post, url, json=payload, timeout=10)
+
+    for attempt in range(retries + 1):
+        await limiter.wait(url)
+        retry_after = None
+        try:
+            response = await loop.run_in_executor(executor, post)
+            if response.status_code not in RETRY_STATUS:
+                response.raise_for_status()
+                return response.json()
+            error = requests.HTTPError(f"HTTP {response.status_code} from {url}", response=response)
+            retry_after = response.headers.get('Retry-After')
+        except (requests.ConnectionError, requests.Timeout) as e:
+            error = e
+
+        if attempt == retries:
+            raise error
+
+        if retry_after and retry_after.isdigit():
+            delay = float(retry_after)
+        else:
+            delay = backoff * 2 ** attempt + random.uniform(0, backoff)
+        await asyncio.sleep(delay)
+
+
+async def fetch_problem_infos_async(problem_ids, concurrency=8, rate=10.0, retries=3, use_cache=True):
+    """Fetch many problems concurrently: bounded in-flight requests, per-host rate limit, retry with backoff.
+
+    Returns {problem_id: info or None} in input order.
+    """
+    limiter = HostRateLimiter(rate)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch_one(executor, problem_id, title_slug):
+        if not title_slug:
+            return None
+        detail_data = load_cached_question(title_slug) if use_cache else None
+        if detail_data is not None:
+            return _parse_question_data(detail_data)
+        async with semaphore:
+            try:
+                detail_data = await _post_with_retry(
+                    executor, limiter, GRAPHQL_URL, _question_payload(title_slug), retries=retries
+                )
+            except Exception as e:
+                print(f"⚠️  Unable to fetch problem #{problem_id} from LeetCode: {e}")
+                return None
+        _cache_fetched_question(title_slug, detail_data)
+        return _parse_question_data(detail_data)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        # Resolve every slug first, on a worker thread: loading the catalog (and refreshing it once on
+        # a miss) is blocking HTTP that must neither stall the event loop nor race between tasks
+        title_slugs = await asyncio.get_running_loop().run_in_executor(
+            executor, lambda: [get_title_slug(problem_id) for problem_id in problem_ids]
+        )
+        infos = await asyncio.gather(*(
+            fetch_one(executor, problem_id, title_slug) for problem_id, title_slug in zip(problem_ids, title_slugs)
+        ))
+    return dict(zip(problem_ids, infos))
+
+
+def prefetch_problem_infos(problem_ids, concurrency=8, use_cache=True):
+    """Synchronous wrapper around fetch_problem_infos_async for batch creation"""
+    try:
+        return asyncio.run(fetch_problem_infos_async(problem_ids, concurrency=concurrency, use_cache=use_cache))
+    except Exception as e:
+        print(f"⚠️  Unable to prefetch problem information: {e}")
+        return {}
+
+
 def _safe_eval_literal(text):
     """Convert LeetCode literal text to Python value."""
     normalized = text.strip()
@@ -138,6 +413,68 @@ def _extract_examples_from_content(content):
     return examples
 
 
+def _parse_bound(text):
+    """Evaluate a constraint bound such as '10^4', '-2^31', '2 * 10^4' or '2^31 - 1'."""
+    text = text.strip().replace('^', '**').replace('×', '*')
+    if not re.fullmatch(r'[\d\s*+\-]+', text):
+        return None
+
+    def _eval(node):
+        if isinstance(node, ast.Constant) and isinstance(node.value, int):
+            return node.value
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub):
+            return -_eval(node.operand)
+        if isinstance(node, ast.BinOp) and isinstance(node.op, (ast.Add, ast.Sub, ast.Mult, ast.Pow)):
+            left, right = _eval(node.left), _eval(node.right)
+            if isinstance(node.op, ast.Add):
+                return left + right
+            if isinstance(node.op, ast.Sub):
+                return left - right
+            if isinstance(node.op, ast.Mult):
+                return left * right
+            return left ** right
+        raise ValueError(text)
+
+    try:
+        return _eval(ast.parse(text, mode='eval').body)
+    except (SyntaxError, ValueError, RecursionError):
+        return None
+
+
+def parse_constraints(content):
+    """Extract bounds from the question's Constraints block.
+
+    Returns e.g. {'nums.length': (1, 1000), 'nums[i]': (-10**6, 10**6), 's.alphabet': '()[]{}'}.
+    Items that are not simple `low <= name <= high` ranges (or `s consists of ... '...'`) are skipped.
+    """
+    m = re.search(r'Constraints:(.*?)(?:</ul>|$)', content or '', flags=re.IGNORECASE | re.DOTALL)
+    if not m:
+        return {}
+
+    block = re.sub(r'<sup>\s*(.*?)\s*</sup>', r'^\1', m.group(1), flags=re.IGNORECASE | re.DOTALL)
+    items = re.findall(r'<li>(.*?)</li>', block, flags=re.IGNORECASE | re.DOTALL) or block.split('\n')
+
+    constraints = {}
+    for item in items:
+        text = html.unescape(re.sub(r'<[^>]+>', '', item)).strip().rstrip('.')
+        text = text.replace('≤', '<=')
+
+        m = re.fullmatch(r'(.+?)\s*<=\s*(.+?)\s*<=\s*(.+)', text)
+        if m:
+            low, high = _parse_bound(m.group(1)), _parse_bound(m.group(3))
+            if low is None or high is None:
+                continue
+            for name in m.group(2).split(','):
+                constraints[name.strip()] = (low, high)
+            continue
+
+        m = re.match(r"(\w+)\s+consists\s+of\b.*?'([^']+)'", text)
+        if m:
+            constraints[f"{m.group(1)}.alphabet"] = m.group(2)
+
+    return constraints
+
+
 def _parse_input_values(input_text, param_names):
     """Parse LeetCode input expression into Python args."""
     if not param_names:
@@ -200,12 +537,13 @@ def build_python_test_cases(content, meta_data):
     return parsed_cases
 
 
-def populate_python_test_cases(problem_id, title_slug, test_cases):
+def populate_python_test_cases(problem_id, title_slug, test_cases, problem_dir=None):
     """Inject extracted test cases into generated solution-python.py."""
     if not test_cases:
         return
 
-    problem_dir = f"problems/{int(problem_id):05d}-{title_slug}"
+    if problem_dir is None:
+        problem_dir = os.path.join(PROJECT_ROOT, 'problems', f"{int(problem_id):05d}-{title_slug}")
     solution_file = f"{problem_dir}/solution-python.py"
 
     try:
@@ -238,13 +576,14 @@ def populate_python_test_cases(problem_id, title_slug, test_cases):
         print(f"⚠️  Unable to auto-fill test cases: {e}")
 
 
-def create_problem(problem_id):
-    """Create LeetCode problem structure"""
+def create_problem(problem_id, info=None, use_cache=True):
+    """Create LeetCode problem structure (info may be prefetched by batch mode)"""
     
-    print(f"🔍 Querying LeetCode problem #{problem_id} information...")
-    
-    # Try to fetch problem information from LeetCode
-    info = get_leetcode_problem_info(problem_id)
+    if info is None:
+        print(f"🔍 Querying LeetCode problem #{problem_id} information...")
+        
+        # Try to fetch problem information from LeetCode
+        info = get_leetcode_problem_info(problem_id, use_cache)
     
     if info:
         print(f"✅ Found problem: {info['title']}")
@@ -252,20 +591,6 @@ def create_problem(problem_id):
         if info.get('topics'):
             print(f"   Tags: {', '.join(info['topics'])}")
         
-        # Call the original create-problem.py script with topics
-        cmd = [
-            sys.executable,
-            'scripts/create-problem.py',
-            str(problem_id),
-            info['title'],
-            info['difficulty']
-        ]
-        
-        # If topics available, pass as additional arguments
-        if info.get('topics'):
-            cmd.append('--topics')
-            cmd.append(','.join(info['topics']))
-        
     else:
         # If API fails, prompt user for manual input
         print(f"❌ Unable to automatically fetch information for problem #{problem_id}")
@@ -273,35 +598,133 @@ def create_problem(problem_id):
         print(f'python scripts/create-problem.py {problem_id} "Problem Title" difficulty')
         return False
     
-    # Execute creation script
+    # Build the problem structure in-process (topics are passed as a list, so commas inside tags survive)
     print(f"\n🚀 Creating problem structure...")
-    result = subprocess.run(cmd, capture_output=False)
+    problem_dir = load_script('create-problem').create_problem_structure(
+        problem_id,
+        info['title'],
+        info['difficulty'],
+        topics=info.get('topics') or None,
+    )
+
+    if problem_dir is None:
+        return False
 
-    if result.returncode == 0 and info:
-        test_cases = build_python_test_cases(info.get('content', ''), info.get('metaData', '{}'))
-        populate_python_test_cases(problem_id, info['titleSlug'], test_cases)
+    test_cases = build_python_test_cases(info.get('content', ''), info.get('metaData', '{}'))
+    populate_python_test_cases(problem_id, info['titleSlug'], test_cases, problem_dir)
     
-    return result.returncode == 0
+    return True
+
+
+def refill_test_cases(problem_id, use_cache=True):
+    """Re-extract test cases for an existing problem (from the question cache when available)"""
+    info = get_leetcode_problem_info(problem_id, use_cache=use_cache)
+    if not info:
+        print(f"❌ Unable to load information for problem #{problem_id}")
+        return False
+
+    test_cases = build_python_test_cases(info.get('content', ''), info.get('metaData', '{}'))
+    if not test_cases:
+        print(f"⚠️  No test cases could be extracted for problem #{problem_id}")
+        return False
+
+    populate_python_test_cases(problem_id, info['titleSlug'], test_cases)
+    return True
+
+
+def read_problem_ids(path):
+    """Read problem IDs from a file (whitespace or comma separated, # starts a comment)"""
+    problem_ids = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.split('#', 1)[0]
+            problem_ids.extend(token for token in re.split(r'[\s,]+', line) if token)
+    return problem_ids
 
 
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: python create.py <problem_number>")
+    args = sys.argv[1:]
+
+    if '--refresh-catalog' in args:
+        args.remove('--refresh-catalog')
+        try:
+            slugs = load_problem_catalog(refresh=True, allow_stale=False)
+            print(f"✅ Problem catalog refreshed: {len(slugs)} problems")
+        except Exception as e:
+            kept = " (the cached copy was left unchanged)" if os.path.exists(CATALOG_FILE) else ""
+            print(f"⚠️  Unable to refresh problem catalog{kept}: {e}")
+            sys.exit(1)
+        if not args:
+            return
+
+    refill_tests = '--refill-tests' in args
+    if refill_tests:
+        args.remove('--refill-tests')
+
+    use_cache = '--no-cache' not in args
+    if not use_cache:
+        args.remove('--no-cache')
+
+    raw_ids = []
+    i = 0
+    while i < len(args):
+        if args[i] == '--from-file':
+            if i + 1 >= len(args):
+                print("❌ --from-file parameter requires a file path")
+                sys.exit(1)
+            try:
+                raw_ids.extend(read_problem_ids(args[i + 1]))
+            except OSError as e:
+                print(f"❌ Unable to read problem IDs: {e}")
+                sys.exit(1)
+            i += 2
+        else:
+            raw_ids.append(args[i])
+            i += 1
+
+    if not raw_ids:
+        print("Usage: python create.py [--refresh-catalog] [--no-cache] [--refill-tests] <problem_number> [problem_number ...] [--from-file ids.txt]")
         print("Example: python create.py 1408")
+        print("Example (batch): python create.py 1 20 26 283")
         sys.exit(1)
     
     try:
-        problem_id = int(sys.argv[1])
+        problem_ids = [int(raw_id) for raw_id in raw_ids]
     except ValueError:
         print("❌ Error: Problem number must be an integer")
         sys.exit(1)
-    
-    success = create_problem(problem_id)
-    
-    if success:
-        print("\n✅ Problem created successfully!")
-    else:
-        print("\n❌ Problem creation failed")
+
+    if refill_tests:
+        failed = [problem_id for problem_id in problem_ids if not refill_test_cases(problem_id, use_cache=use_cache)]
+        if failed:
+            sys.exit(1)
+        return
+
+    if len(problem_ids) == 1:
+        success = create_problem(problem_ids[0], use_cache=use_cache)
+        
+        if success:
+            print("\n✅ Problem created successfully!")
+        else:
+            print("\n❌ Problem creation failed")
+            sys.exit(1)
+        return
+
+    # Batch mode: one process, one pooled session and one catalog load for every problem
+    start = time.perf_counter()
+    print(f"🔍 Fetching {len(problem_ids)} problems from LeetCode...")
+    infos = prefetch_problem_infos(problem_ids, use_cache=use_cache)
+
+    failed = []
+    for index, problem_id in enumerate(problem_ids, 1):
+        print(f"\n=== [{index}/{len(problem_ids)}] Problem #{problem_id} ===")
+        if not create_problem(problem_id, infos.get(problem_id), use_cache):
+            failed.append(problem_id)
+
+    elapsed = time.perf_counter() - start
+    print(f"\n📦 Batch finished in {elapsed:.1f}s: {len(problem_ids) - len(failed)} created, {len(failed)} failed")
+    if failed:
+        print(f"❌ Failed: {', '.join(str(problem_id) for problem_id in failed)}")
         sys.exit(1)
 
 
@@ -2,65 +2,1348 @@
 Shared utilities for LeetCode solution files.
 """
 
+import functools
+import math
+import os
+
+PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+
+_loaded_modules = {}
+
+
+def load_module(path, name=None):
+    """Import a Python file by path (scripts and solutions use hyphenated, non-importable names).
+
+    Modules are cached per absolute path, so repeated loads in one process are free.
+    """
+    import importlib.util
+
+    path = os.path.abspath(path)
+    if path not in _loaded_modules:
+        if name is None:
+            name = os.path.splitext(os.path.basename(path))[0].replace('-', '_')
+        spec = importlib.util.spec_from_file_location(name, path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _loaded_modules[path] = module
+    return _loaded_modules[path]
+
+
+def load_script(name):
+    """Import a helper script from scripts/, e.g. load_script('create-problem')"""
+    return load_module(os.path.join(PROJECT_ROOT, 'scripts', f"{name}.py"))
+
+
+def option_value(args, name, convert, default):
+    """Pop '--name value' from a script's argument list; exit with a message if the value is missing or invalid"""
+    import sys
+
+    if name not in args:
+        return default
+    index = args.index(name)
+    try:
+        value = convert(args[index + 1])
+    except (IndexError, ValueError):
+        print(f"❌ {name} parameter requires a value")
+        sys.exit(1)
+    del args[index:index + 2]
+    return value
+
+
+def discover_solution_files(problems_dir=None, filters=None):
+    """List solution-python.py and alt*-python.py files, primary solution first within each problem.
+
+    filters: optional problem IDs or folder substrings, e.g. ['20', 'move-zeroes'].
+    """
+    import re
+
+    problems_dir = problems_dir or os.path.join(PROJECT_ROOT, 'problems')
+    if not os.path.isdir(problems_dir):
+        return []
+
+    files = []
+    for folder in sorted(os.listdir(problems_dir)):
+        folder_path = os.path.join(problems_dir, folder)
+        if not os.path.isdir(folder_path) or not re.match(r'\d{5}-', folder):
+            continue
+        if filters and not any(_matches_problem(folder, f) for f in filters):
+            continue
+
+        names = os.listdir(folder_path)
+        if 'solution-python.py' in names:
+            files.append(os.path.join(folder_path, 'solution-python.py'))
+        for name in sorted(names):
+            if re.match(r'alt\d+_[\w-]*-python\.py$', name):
+                files.append(os.path.join(folder_path, name))
+    return files
+
+
+def _matches_problem(folder, problem_filter):
+    """Match a problem folder by numeric ID ('20' matches 00020-...) or by substring"""
+    problem_filter = str(problem_filter)
+    if problem_filter.isdigit():
+        return int(folder[:5]) == int(problem_filter)
+    return problem_filter in folder
+
+
+def load_solution(path):
+    """Import a solution file under a unique module name derived from its problem folder"""
+    folder = os.path.basename(os.path.dirname(os.path.abspath(path)))
+    stem = os.path.splitext(os.path.basename(path))[0]
+    name = f"problem_{folder}_{stem}".replace('-', '_')
+    return load_module(path, name)
+
+
+COMPLEXITY_SIDECAR = 'complexity.json'
+
+
+def record_complexity(solution_file, method):
+    """Analyze a solve() method and record the result in its problem's complexity.json sidecar.
+
+    The sidecar maps solution file names to {"time": ..., "space": ...} and is only
+    rewritten when the analysis result differs, so test runs never touch source files.
+    Returns (time_complexity, space_complexity).
+    """
+    import json
+
+    time_c, space_c = analyze_complexity(method)
+
+    sidecar = os.path.join(os.path.dirname(os.path.abspath(solution_file)), COMPLEXITY_SIDECAR)
+    try:
+        with open(sidecar, 'r', encoding='utf-8') as f:
+            entries = json.load(f)
+    except (OSError, ValueError):
+        entries = {}
+
+    entry = {'time': time_c, 'space': space_c}
+    name = os.path.basename(solution_file)
+    if entries.get(name) != entry:
+        entries[name] = entry
+        tmp_file = f"{sidecar}.{os.getpid()}.tmp"
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(entries, f, indent=2, sort_keys=True)
+            f.write('\n')
+        os.replace(tmp_file, sidecar)
+
+    return time_c, space_c
+
+
+# Bump whenever the analysis rules change: cached results from older analyzers are ignored
+ANALYZER_VERSION = 2
+ANALYSIS_CACHE_FILE = os.path.join(PROJECT_ROOT, '.cache', 'complexity-cache.json')
+
+_analysis_cache = None
+_pending_analysis = {}         # results not yet written by this process
+_flush_registered_pid = None   # process that registered the exit-time flush (forked workers re-register)
+
+
+def _load_analysis_cache():
+    """Load {source_hash: [time, space]} from disk once per process"""
+    import json
+
+    global _analysis_cache
+    if _analysis_cache is None:
+        try:
+            with open(ANALYSIS_CACHE_FILE, 'r', encoding='utf-8') as f:
+                _analysis_cache = json.load(f)
+        except (OSError, ValueError):
+            _analysis_cache = {}
+    return _analysis_cache
+
+
+def _save_analysis_result(key, result):
+    """Record one analysis result; new results reach the disk in one write when the process exits"""
+    import atexit
+    from multiprocessing import util
+
+    global _flush_registered_pid
+    _load_analysis_cache()[key] = list(result)
+    _pending_analysis[key] = list(result)
+    if _flush_registered_pid != os.getpid():
+        # Pool workers leave through os._exit and skip atexit, but run multiprocessing finalizers
+        atexit.register(flush_analysis_cache)
+        util.Finalize(None, flush_analysis_cache, exitpriority=0)
+        _flush_registered_pid = os.getpid()
+
+
+def flush_analysis_cache():
+    """Merge this process's new analysis results into the on-disk memo, keeping other processes' entries"""
+    import json
+
+    if not _pending_analysis:
+        return
+    try:
+        with open(ANALYSIS_CACHE_FILE, 'r', encoding='utf-8') as f:
+            on_disk = json.load(f)
+    except (OSError, ValueError):
+        on_disk = {}
+    on_disk.update(_pending_analysis)
+    _pending_analysis.clear()
+
+    try:
+        os.makedirs(os.path.dirname(ANALYSIS_CACHE_FILE), exist_ok=True)
+        tmp_file = f"{ANALYSIS_CACHE_FILE}.{os.getpid()}.tmp"
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(on_disk, f, separators=(',', ':'), sort_keys=True)
+        os.replace(tmp_file, ANALYSIS_CACHE_FILE)
+    except OSError:
+        pass  # a read-only checkout still gets the in-memory cache
+
+
+def _analyzed_source(lines, qualname, first_line):
+    """The source an analysis depends on: the enclosing class (its methods form the call graph) or the function"""
+    import re
+    import inspect
+
+    start = first_line - 1
+    class_name = qualname.rpartition('.')[0].split('.')[-1]
+    if class_name:
+        header = re.compile(rf"\s*class\s+{re.escape(class_name)}\b")
+        start = next((i for i in range(start, -1, -1) if header.match(lines[i])), start)
+    return ''.join(inspect.getblock(lines[start:]))
+
 
 def analyze_complexity(method):
-    """Heuristic AST-based complexity analyzer for a solve() method.
+    """Static complexity analyzer for a solution method.
+
+    The whole Solution class is analyzed: calls to self.<helper>() and nested functions are
+    followed through a call graph, recursion is classified (linear, binary, divide-and-conquer,
+    tree traversal, memoized, exponential), comprehensions count as loops and known builtins are
+    charged their cost (sorted = n log n, list.pop(0) / insert / `x in list` = n, heapq = log n).
+
+    Results are memoized on disk, keyed by a hash of the enclosing class's source (the whole call
+    graph, not just the method), the method's qualified name and ANALYZER_VERSION, so edits elsewhere
+    in a solution file (tests, input generators) keep the entry valid and unchanged classes are never
+    re-analyzed.
 
     Returns (time_complexity, space_complexity) as strings, e.g. ("O(n)", "O(1)").
     """
-    import ast
+    import hashlib
     import inspect
-    import textwrap
+    import linecache
 
+    # Decorators such as @lru_cache / @cache hide the function (and its __code__) behind a wrapper
+    func = inspect.unwrap(getattr(method, '__func__', method))
+    qualname = getattr(func, '__qualname__', func.__name__)
     try:
-        src = textwrap.dedent(inspect.getsource(method))
-        tree = ast.parse(src)
+        filename = inspect.getsourcefile(func)
+        linecache.checkcache(filename)
+        lines = linecache.getlines(filename)
+        block = _analyzed_source(lines, qualname, func.__code__.co_firstlineno)
     except Exception:
         return "O(?)", "O(?)"
+    if not block:
+        return "O(?)", "O(?)"
+    src = ''.join(lines)
+
+    key = hashlib.sha256(f"{ANALYZER_VERSION}\0{qualname}\0{block}".encode('utf-8')).hexdigest()
+    cached = _load_analysis_cache().get(key)
+    if cached:
+        return tuple(cached)
+
+    result = _analyze_source(src, qualname, func.__code__.co_firstlineno)
+    if "O(?)" not in result:
+        _save_analysis_result(key, result)
+    return result
+
 
-    # --- Time complexity: estimate from max loop-nesting depth ---
-    def _max_loop_depth(node, depth=0):
-        if isinstance(node, (ast.For, ast.While)):
-            depth += 1
-        child_depths = [_max_loop_depth(c, depth) for c in ast.iter_child_nodes(node)]
-        return max(child_depths) if child_depths else depth
-
-    depth = _max_loop_depth(tree)
-    has_log = any(p in src for p in ("//= 2", ">>= 1", "// 2", "math.log", "bisect"))
-
-    if depth == 0:
-        time_c = "O(1)"
-    elif depth == 1:
-        time_c = "O(n log n)" if has_log else "O(n)"
-    elif depth == 2:
-        time_c = "O(n^2)"
+def _analyze_source(src, qualname, first_line=None):
+    """Parse a module and analyze the function `qualname` (e.g. 'Solution.solve') in it"""
+    import ast
+
+    try:
+        tree = ast.parse(src)
+    except SyntaxError:
+        return "O(?)", "O(?)"
+
+    class_name, _, func_name = qualname.rpartition('.')
+    class_name = class_name.split('.')[-1]
+
+    def _matches(node):
+        return (
+            isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.name == func_name
+            and (first_line is None or first_line in
+                 [node.lineno] + [d.lineno for d in node.decorator_list])
+        )
+
+    # Class methods form the call graph; a plain module-level function is analyzed alone
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ClassDef) and node.name == class_name:
+            methods = {n.name: n for n in node.body if isinstance(n, (ast.FunctionDef, ast.AsyncFunctionDef))}
+            target = methods.get(func_name)
+            if target is not None and _matches(target):
+                break
     else:
-        time_c = "O(n^%d)" % depth
+        methods = {}
+        target = next((n for n in tree.body if _matches(n)), None)
+        if target is None:
+            return "O(?)", "O(?)"
 
-    # --- Space complexity: detect heap allocations ---
-    class _SpaceChecker(ast.NodeVisitor):
-        found = False
+    time_c, space_c = _ComplexityAnalyzer(methods).analyze(target)
+    return _complexity_label(time_c), _complexity_label(space_c)
 
-        def visit_List(self, node):
-            self.found = True
-            self.generic_visit(node)
 
-        def visit_Dict(self, node):
-            self.found = True
-            self.generic_visit(node)
+# Costs are (polynomial degree, log power) pairs: (1, 1) is O(n log n); max() composes
+# sequential code and _nest() composes loops / calls inside loops
+_O1, _LOG, _N, _NLOGN = (0, 0), (0, 1), (1, 0), (1, 1)
+_EXP = (math.inf, 0)
 
-        def visit_Set(self, node):
-            self.found = True
-            self.generic_visit(node)
+# Builtins that walk their whole (non-constant) argument
+_LINEAR_BUILTINS = {
+    'list', 'set', 'dict', 'tuple', 'frozenset', 'bytes', 'bytearray', 'sum', 'any', 'all',
+    'Counter', 'deque', 'OrderedDict',
+}
+# Builtins that allocate a container holding their argument's elements
+_ALLOCATING_BUILTINS = {
+    'list', 'set', 'dict', 'tuple', 'frozenset', 'bytes', 'bytearray', 'sorted',
+    'Counter', 'deque', 'OrderedDict',
+}
+_HASH_CONSTRUCTORS = {'dict', 'set', 'frozenset', 'Counter', 'defaultdict', 'OrderedDict'}
+# Container / string methods that scan or copy the receiver
+_LINEAR_METHODS = {
+    'index', 'count', 'remove', 'reverse', 'copy', 'extend', 'join', 'split', 'replace',
+    'strip', 'lstrip', 'rstrip', 'lower', 'upper', 'find', 'rfind', 'insert', 'tolist',
+}
+_GROWTH_METHODS = {'append', 'appendleft', 'add', 'extend', 'insert', 'setdefault', 'update'}
+_MODULE_COSTS = {
+    'heapq': {'heappush': _LOG, 'heappop': _LOG, 'heappushpop': _LOG, 'heapreplace': _LOG,
+              'heapify': _N, 'nlargest': _NLOGN, 'nsmallest': _NLOGN},
+    'bisect': {'bisect': _LOG, 'bisect_left': _LOG, 'bisect_right': _LOG,
+               'insort': _N, 'insort_left': _N, 'insort_right': _N},
+}
+# Argument names / attributes that walk a linked structure (each node visited once)
+_STRUCTURAL_ATTRS = {'left', 'right', 'next', 'children', 'child', 'parent'}
+_MEMO_DECORATORS = {'cache', 'lru_cache'}
 
-        def visit_Call(self, node):
-            heap_types = ("list", "dict", "set", "defaultdict", "Counter", "deque")
-            if isinstance(node.func, ast.Name) and node.func.id in heap_types:
-                self.found = True
-            self.generic_visit(node)
 
-    checker = _SpaceChecker()
-    checker.visit(tree)
-    space_c = "O(n)" if checker.found else "O(1)"
+def _nest(outer, inner):
+    """Cost of running `inner` once per iteration of `outer`"""
+    return outer[0] + inner[0], outer[1] + inner[1]
 
-    return time_c, space_c
+
+def _complexity_label(cost):
+    """(degree, log power) -> 'O(n log n)' style label"""
+    degree, log_power = cost
+    if degree == math.inf:
+        return "O(2^n)"
+    if degree == 0 and log_power == 0:
+        return "O(1)"
+    parts = []
+    if degree:
+        parts.append("n" if degree == 1 else "n^%d" % degree)
+    if log_power:
+        parts.append("log n" if log_power == 1 else "log^%d n" % log_power)
+    return "O(%s)" % ' '.join(parts)
+
+
+def _is_constant(node):
+    """Literal (or literal-only container / range) whose size does not depend on the input"""
+    import ast
+
+    if isinstance(node, ast.Constant):
+        return True
+    if isinstance(node, (ast.Tuple, ast.List, ast.Set)):
+        return all(_is_constant(e) for e in node.elts)
+    if isinstance(node, ast.Dict):
+        return all(k is not None and _is_constant(k) and _is_constant(v) for k, v in zip(node.keys, node.values))
+    if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id == 'range':
+        return all(_is_constant(a) for a in node.args)
+    return False
+
+
+def _is_halving(node):
+    """`x // 2` / `x >> 1` style expression"""
+    import ast
+
+    return any(
+        isinstance(n, ast.BinOp) and isinstance(n.op, (ast.FloorDiv, ast.RShift))
+        for n in ast.walk(node)
+    )
+
+
+class _Frame:
+    """Per-function state while walking its body"""
+
+    def __init__(self, func, parent=None):
+        self.func = func
+        self.params = {a.arg for a in func.args.args + func.args.kwonlyargs} - {'self'}
+        self.kinds = dict(parent.kinds) if parent else {}      # name -> 'hash' | 'list' | 'const'
+        self.nested = dict(parent.nested) if parent else {}    # nested def name -> node
+        self.halving = set()                                   # names bound to x // 2
+        self.loops = []                                        # trip costs of enclosing loops
+        self.recursive_calls = {}                              # call node id -> (inside_loop, shrink)
+        self.space = _O1
+        self.exit_cost = _O1                                   # work in `return` inside loops
+
+    def loop_multiplier(self):
+        total = _O1
+        for trip in self.loops:
+            total = _nest(total, trip)
+        return total
+
+    def allocate(self, size):
+        self.space = max(self.space, size)
+
+    def grow(self, per_iteration=_O1):
+        """A container gains elements on every iteration of the enclosing loops"""
+        if self.loops:
+            self.space = max(self.space, _nest(self.loop_multiplier(), per_iteration))
+
+
+class _ComplexityAnalyzer:
+    """Walk function bodies bottom-up, following calls between a class's methods"""
+
+    def __init__(self, methods):
+        self.methods = methods
+        self.results = {}
+        self.active = set()
+
+    def analyze(self, func, parent=None):
+        """Return (time, space) costs of one function, memoized per function node"""
+        key = id(func)
+        if key in self.results:
+            return self.results[key]
+        if key in self.active:
+            # Mutual recursion: charge the cycle as one linear pass
+            return _N, _N
+        self.active.add(key)
+        frame = _Frame(func, parent)
+        cost = max(self._block(func.body, frame), frame.exit_cost)
+        result = self._apply_recursion(frame, cost)
+        self.active.discard(key)
+        self.results[key] = result
+        return result
+
+    # --- recursion ---
+
+    def _apply_recursion(self, frame, work):
+        """Combine per-call work with the recursion pattern of the function's self-calls"""
+        if not frame.recursive_calls:
+            return work, frame.space
+
+        calls = list(frame.recursive_calls.values())
+        shrinks = {shrink for _, shrink in calls}
+        # Branches: calls on exclusive if/else paths (binary search) count once
+        branches = max(1, self._calls_per_path(frame.func.body, frame.recursive_calls))
+        if self._is_memoized(frame):
+            # Each distinct state is solved once
+            time_c, depth = _nest(_N, work), _N
+        elif 'structural' in shrinks:
+            # Tree / linked-list traversal: every node is visited once
+            time_c, depth = _nest(_N, work), _N
+        elif any(in_loop for in_loop, _ in calls) or (branches > 1 and shrinks != {'halve'}):
+            # Backtracking or multi-branch recursion on n - 1
+            time_c, depth = _EXP, _N
+        elif shrinks == {'halve'} and branches > 1:
+            # Divide and conquer, T(n) = a T(n / 2) + f(n)
+            critical = math.log2(branches)
+            if work[0] < critical:
+                time_c = (critical if critical != 1 else 1, 0)
+            elif work[0] == critical:
+                time_c = (work[0], work[1] + 1)
+            else:
+                time_c = work
+            return time_c, max(_LOG, frame.space)
+        elif shrinks == {'halve'}:
+            # Binary recursion, T(n) = T(n / 2) + f(n)
+            time_c = work if work[0] >= 1 else _nest(_LOG, work)
+            return time_c, max(_LOG, frame.space)
+        else:
+            # Linear recursion, T(n) = T(n - 1) + f(n)
+            time_c, depth = _nest(_N, work), _N
+        return time_c, max(depth, _nest(depth, frame.space))
+
+    def _calls_per_path(self, statements, call_ids):
+        """Most recursive calls made along any single path through the statements"""
+        import ast
+
+        total = 0
+        for index, node in enumerate(statements):
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+                continue
+            if isinstance(node, ast.If):
+                orelse = node.orelse
+                if node.body and isinstance(node.body[-1], (ast.Return, ast.Raise)):
+                    # `if ...: return` makes the rest of the block an implicit else
+                    orelse = orelse + statements[index + 1:]
+                total += self._count_calls(node.test, call_ids) + max(
+                    self._calls_per_path(node.body, call_ids), self._calls_per_path(orelse, call_ids))
+                if orelse is not node.orelse:
+                    break
+            elif isinstance(node, (ast.For, ast.AsyncFor, ast.While, ast.With, ast.Try)):
+                total += sum(self._count_calls(child, call_ids) for child in ast.iter_child_nodes(node)
+                             if not isinstance(child, ast.stmt))
+                for field in ('body', 'orelse', 'finalbody'):
+                    total += self._calls_per_path(getattr(node, field, []), call_ids)
+            else:
+                total += self._count_calls(node, call_ids)
+        return total
+
+    @staticmethod
+    def _count_calls(node, call_ids):
+        import ast
+
+        if isinstance(node, ast.IfExp):
+            return _ComplexityAnalyzer._count_calls(node.test, call_ids) + max(
+                _ComplexityAnalyzer._count_calls(node.body, call_ids),
+                _ComplexityAnalyzer._count_calls(node.orelse, call_ids))
+        return int(id(node) in call_ids) + sum(
+            _ComplexityAnalyzer._count_calls(child, call_ids) for child in ast.iter_child_nodes(node)
+            if not isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda)))
+
+    def _is_memoized(self, frame):
+        """@cache / @lru_cache, or an early `if state in memo` / `visited` check on a parameter"""
+        import ast
+
+        for decorator in frame.func.decorator_list:
+            target = decorator.func if isinstance(decorator, ast.Call) else decorator
+            name = target.attr if isinstance(target, ast.Attribute) else getattr(target, 'id', None)
+            if name in _MEMO_DECORATORS:
+                return True
+        for node in self._walk_body(frame.func):
+            if isinstance(node, ast.Compare) and any(isinstance(op, (ast.In, ast.NotIn)) for op in node.ops):
+                names = {n.id for n in ast.walk(node.left) if isinstance(n, ast.Name)}
+                if names & frame.params and isinstance(node.comparators[0], (ast.Name, ast.Attribute)):
+                    return True
+        return False
+
+    def _shrink(self, call, frame):
+        """How a recursive call's arguments shrink: 'halve', 'structural' or 'decrement'"""
+        import ast
+
+        args = list(call.args) + [k.value for k in call.keywords]
+        for arg in args:
+            for node in ast.walk(arg):
+                if isinstance(node, ast.Attribute) and node.attr in _STRUCTURAL_ATTRS:
+                    return 'structural'
+        for arg in args:
+            if _is_halving(arg) or any(isinstance(n, ast.Name) and n.id in frame.halving for n in ast.walk(arg)):
+                return 'halve'
+        return 'decrement'
+
+    @staticmethod
+    def _walk_body(func):
+        """ast.walk over a function body without descending into nested functions"""
+        import ast
+
+        stack = list(func.body)
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(
+                child for child in ast.iter_child_nodes(node)
+                if not isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda))
+            )
+
+    # --- statements ---
+
+    def _block(self, statements, frame):
+        return max((self._statement(s, frame) for s in statements), default=_O1)
+
+    def _statement(self, node, frame):
+        import ast
+
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            frame.nested[node.name] = node
+            return _O1
+        if isinstance(node, ast.ClassDef):
+            return _O1
+        if isinstance(node, ast.Return) and frame.loops:
+            # Leaves every loop, so it runs once per call rather than once per iteration
+            frame.exit_cost = max(frame.exit_cost, self._expr(node.value, frame))
+            return _O1
+        if isinstance(node, (ast.For, ast.AsyncFor)):
+            iter_cost = self._expr(node.iter, frame)
+            trip = self._trip(node.iter, frame)
+            frame.loops.append(trip)
+            body = self._block(node.body, frame)
+            frame.loops.pop()
+            return max(iter_cost, _nest(trip, body), self._block(node.orelse, frame))
+        if isinstance(node, ast.While):
+            trip = _LOG if self._while_halves(node) else _N
+            frame.loops.append(trip)
+            body = max(self._expr(node.test, frame), self._block(node.body, frame))
+            frame.loops.pop()
+            return max(_nest(trip, body), self._block(node.orelse, frame))
+        if isinstance(node, (ast.Assign, ast.AnnAssign, ast.AugAssign)):
+            return self._assign(node, frame)
+        if isinstance(node, ast.If):
+            return max(self._expr(node.test, frame), self._block(node.body, frame), self._block(node.orelse, frame))
+
+        cost = _O1
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, ast.stmt):
+                cost = max(cost, self._statement(child, frame))
+            elif isinstance(child, ast.expr):
+                cost = max(cost, self._expr(child, frame))
+            elif isinstance(child, (ast.ExceptHandler, ast.withitem, ast.match_case)):
+                cost = max(cost, self._statement(child, frame))
+        return cost
+
+    def _assign(self, node, frame):
+        import ast
+
+        value = node.value
+        cost = self._expr(value, frame) if value is not None else _O1
+        targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+        for target in targets:
+            if isinstance(target, ast.Subscript):
+                cost = max(cost, self._expr(target.value, frame), self._expr(target.slice, frame))
+                if frame.kinds.get(self._name(target.value)) == 'hash':
+                    frame.grow()
+            if isinstance(target, ast.Name) and value is not None and not isinstance(node, ast.AugAssign):
+                kind = self._kind(value)
+                if kind:
+                    frame.kinds[target.id] = kind
+                else:
+                    frame.kinds.pop(target.id, None)
+                if _is_halving(value):
+                    frame.halving.add(target.id)
+        if isinstance(node, ast.AugAssign) and isinstance(node.op, ast.Add) and self._grows_sequence(node.value):
+            # s += [x] / s += "x" extends the target
+            frame.grow()
+        return cost
+
+    @staticmethod
+    def _grows_sequence(node):
+        import ast
+
+        return isinstance(node, (ast.List, ast.ListComp, ast.JoinedStr)) or (
+            isinstance(node, ast.Constant) and isinstance(node.value, str)
+        )
+
+    @staticmethod
+    def _name(node):
+        import ast
+
+        if isinstance(node, ast.Name):
+            return node.id
+        if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name) and node.value.id == 'self':
+            return 'self.' + node.attr
+        return None
+
+    def _kind(self, value):
+        """Classify an assigned value: 'hash' (O(1) lookups), 'const' (input-independent) or 'list'"""
+        import ast
+
+        if isinstance(value, (ast.Dict, ast.Set, ast.DictComp, ast.SetComp)):
+            return 'hash'
+        if isinstance(value, ast.List) and not value.elts:
+            # [] is an accumulator, not a constant lookup table
+            return 'list'
+        if _is_constant(value):
+            return 'const'
+        if isinstance(value, ast.Call):
+            func = value.func
+            name = func.id if isinstance(func, ast.Name) else getattr(func, 'attr', None)
+            if name in _HASH_CONSTRUCTORS:
+                return 'hash'
+            if name in ('list', 'sorted', 'deque'):
+                return 'list'
+        if isinstance(value, (ast.List, ast.ListComp)):
+            return 'list'
+        return None
+
+    # --- loops ---
+
+    def _trip(self, iterable, frame):
+        """Iterations of `for _ in iterable`"""
+        import ast
+
+        if _is_constant(iterable):
+            return _O1
+        if isinstance(iterable, ast.Name) and frame.kinds.get(iterable.id) == 'const':
+            return _O1
+        if isinstance(iterable, ast.Call) and isinstance(iterable.func, ast.Name) \
+                and iterable.func.id in ('enumerate', 'reversed', 'zip') and iterable.args:
+            return max(self._trip(arg, frame) for arg in iterable.args)
+        return _N
+
+    def _while_halves(self, node):
+        """Binary-search style loop: a variable tested in the condition is halved or moved to a midpoint"""
+        import ast
+
+        tested = {n.id for n in ast.walk(node.test) if isinstance(n, ast.Name)}
+        midpoints = set()
+        body = [n for stmt in node.body for n in ast.walk(stmt)]
+        for n in body:
+            if isinstance(n, ast.AugAssign) and isinstance(n.op, (ast.FloorDiv, ast.RShift)) \
+                    and isinstance(n.target, ast.Name) and n.target.id in tested:
+                return True
+            if isinstance(n, ast.Assign) and _is_halving(n.value):
+                midpoints.update(t.id for t in n.targets if isinstance(t, ast.Name))
+        for n in body:
+            if isinstance(n, ast.Assign) and any(isinstance(t, ast.Name) and t.id in tested for t in n.targets):
+                if midpoints & {m.id for m in ast.walk(n.value) if isinstance(m, ast.Name)} or _is_halving(n.value):
+                    return True
+        return False
+
+    # --- expressions ---
+
+    def _expr(self, node, frame):
+        import ast
+
+        if node is None or isinstance(node, (ast.Constant, ast.Name, ast.Lambda)):
+            return _O1
+        if isinstance(node, ast.Call):
+            return self._call(node, frame)
+        if isinstance(node, (ast.ListComp, ast.SetComp, ast.DictComp, ast.GeneratorExp)):
+            return self._comprehension(node, frame)
+        if isinstance(node, ast.Compare):
+            cost = max(self._expr(node.left, frame), *(self._expr(c, frame) for c in node.comparators))
+            for op, container in zip(node.ops, node.comparators):
+                if isinstance(op, (ast.In, ast.NotIn)):
+                    cost = max(cost, self._membership(container, frame))
+            return cost
+        if isinstance(node, ast.Subscript):
+            cost = max(self._expr(node.value, frame), self._expr(node.slice, frame))
+            if isinstance(node.slice, ast.Slice) and not _is_constant(node.value):
+                # Slicing copies
+                frame.allocate(_N)
+                cost = max(cost, _N)
+            return cost
+        if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Mult):
+            cost = max(self._expr(node.left, frame), self._expr(node.right, frame))
+            sides = (node.left, node.right)
+            if any(isinstance(s, (ast.List, ast.Tuple)) for s in sides) and not all(_is_constant(s) for s in sides):
+                # [0] * n
+                frame.allocate(_N)
+                cost = max(cost, _N)
+            return cost
+
+        return max(
+            (self._expr(child, frame) for child in ast.iter_child_nodes(node) if isinstance(child, ast.expr)),
+            default=_O1,
+        )
+
+    def _comprehension(self, node, frame):
+        import ast
+
+        cost = _O1
+        trips = _O1
+        for generator in node.generators:
+            cost = max(cost, _nest(trips, self._expr(generator.iter, frame)))
+            trips = _nest(trips, self._trip(generator.iter, frame))
+        frame.loops.append(trips)
+        elements = [node.key, node.value] if isinstance(node, ast.DictComp) else [node.elt]
+        element = max(self._expr(e, frame) for e in elements + [c for g in node.generators for c in g.ifs])
+        frame.loops.pop()
+        if not isinstance(node, ast.GeneratorExp):
+            frame.allocate(trips)
+        return max(cost, _nest(trips, element))
+
+    def _membership(self, container, frame):
+        """Cost of `x in container`"""
+        import ast
+
+        if _is_constant(container) or isinstance(container, (ast.Dict, ast.Set, ast.DictComp, ast.SetComp)):
+            return _O1
+        name = self._name(container)
+        if name and frame.kinds.get(name) in ('hash', 'const'):
+            return _O1
+        if isinstance(container, ast.Call):
+            func = container.func
+            called = func.id if isinstance(func, ast.Name) else getattr(func, 'attr', None)
+            if called in _HASH_CONSTRUCTORS or called in ('keys', 'range'):
+                return _O1
+        return _N
+
+    def _call(self, node, frame):
+        import ast
+
+        func = node.func
+        cost = max(
+            [self._expr(a, frame) for a in node.args]
+            + [self._expr(k.value, frame) for k in node.keywords]
+            + [self._expr(func.value, frame) if isinstance(func, ast.Attribute) else _O1]
+        )
+        callee = None
+        if isinstance(func, ast.Name):
+            callee = frame.nested.get(func.id)
+            if callee is None and not frame.nested and func.id == frame.func.name and not self.methods:
+                callee = frame.func
+        elif isinstance(func, ast.Attribute) and isinstance(func.value, ast.Name) and func.value.id == 'self':
+            callee = self.methods.get(func.attr)
+
+        if callee is frame.func:
+            frame.recursive_calls[id(node)] = (bool(frame.loops), self._shrink(node, frame))
+            return cost
+        if callee is not None:
+            time_c, space_c = self.analyze(callee, frame if isinstance(func, ast.Name) else None)
+            frame.allocate(space_c)
+            return max(cost, time_c)
+
+        return max(cost, self._builtin_cost(node, frame))
+
+    def _builtin_cost(self, node, frame):
+        """Intrinsic cost of a call to a builtin, container method or stdlib helper"""
+        import ast
+
+        func = node.func
+        args = node.args
+        walks_input = bool(args) and not all(_is_constant(a) for a in args)
+
+        if isinstance(func, ast.Name):
+            name = func.id
+            if name == 'sorted':
+                frame.allocate(_N)
+                return _NLOGN
+            if name in ('min', 'max'):
+                return _N if len(args) == 1 and walks_input else _O1
+            if name in _LINEAR_BUILTINS and walks_input:
+                if name in _ALLOCATING_BUILTINS:
+                    frame.allocate(_N)
+                return _N
+            return _O1
+
+        if not isinstance(func, ast.Attribute):
+            return _O1
+        method = func.attr
+        receiver = func.value
+        if isinstance(receiver, ast.Name) and receiver.id in _MODULE_COSTS:
+            if method in ('heappush', 'insort', 'insort_left', 'insort_right'):
+                frame.grow()
+            return _MODULE_COSTS[receiver.id].get(method, _O1)
+
+        kind = frame.kinds.get(self._name(receiver))
+        if method in _GROWTH_METHODS:
+            frame.grow(_N if method in ('extend', 'update') else _O1)
+        if method == 'sort':
+            return _NLOGN
+        if method == 'pop':
+            # pop() / pop(-1) are O(1); pop(i) shifts the tail of a list
+            if not args or kind in ('hash', 'const') or (
+                    isinstance(args[0], ast.UnaryOp) and isinstance(args[0].op, ast.USub)):
+                return _O1
+            return _N
+        if method in _LINEAR_METHODS and kind != 'hash':
+            if method == 'copy':
+                frame.allocate(_N)
+            return _N
+        if method in ('extend', 'update'):
+            return _N
+        return _O1
+
+
+# --- Harness helpers shared by the measurement / benchmark scripts ---
+
+def get_entry_point(solution):
+    """Return the bound method a harness should call: solve() if defined, else the first public method."""
+    cls = type(solution)
+    if callable(getattr(cls, 'solve', None)):
+        return solution.solve
+    for name, value in vars(cls).items():
+        if callable(value) and not name.startswith('_'):
+            return getattr(solution, name)
+    raise AttributeError(f"{cls.__name__} defines no public method")
+
+
+def get_problem_hook(path, name):
+    """Return a module-level harness hook (generate_input, canonical_output, ...) for a solution file.
+
+    Alternative solutions fall back to the hook defined in their problem's solution-python.py.
+    """
+    hook = getattr(load_solution(path), name, None)
+    primary = os.path.join(os.path.dirname(os.path.abspath(path)), 'solution-python.py')
+    if hook is None and os.path.abspath(path) != primary and os.path.exists(primary):
+        hook = getattr(load_solution(primary), name, None)
+    return hook
+
+
+def get_input_generator(path):
+    """Return the generate_input(n, rng) function for a solution file."""
+    return get_problem_hook(path, 'generate_input')
+
+
+def canonical_output(path, args, result):
+    """Normalize one call's outcome so different variants of a problem can be compared.
+
+    Uses the problem's canonical_output(args, result) hook when defined (e.g. "first k elements,
+    any order"); otherwise the return value, or the mutated arguments for in-place solutions,
+    with array-like values converted to lists.
+    """
+    hook = get_problem_hook(path, 'canonical_output')
+    if hook is not None:
+        return hook(args, result)
+    if result is None:
+        return tuple(_comparable(a) for a in args)
+    return _comparable(result)
+
+
+def _comparable(value):
+    """ndarray / array.array / memoryview results compare as plain lists"""
+    return value.tolist() if hasattr(value, 'tolist') else value
+
+
+def copy_args(args):
+    """Copy mutable sequence arguments so in-place solutions can be re-run on the same input."""
+    import array
+    import copy
+
+    return tuple(
+        memoryview(bytearray(a)).cast(a.format) if isinstance(a, memoryview)
+        else copy.copy(a) if isinstance(a, (list, bytearray, array.array)) else a
+        for a in args
+    )
+
+
+# Buffer-backed input modes: list[int] arguments re-packed as int64 buffers (8 bytes per element
+# instead of a pointer plus a boxed int), e.g. for multi-million-element in-place runs
+BUFFER_MODES = ('array', 'memoryview')
+
+
+def to_buffer_args(args, mode):
+    """Re-pack list[int] arguments as array.array('q') or a memoryview over one.
+
+    Other arguments (and lists holding non-ints or values outside int64) are passed through
+    unchanged; mode None returns args as-is.
+    """
+    import array
+
+    if mode is None:
+        return args
+    if mode not in BUFFER_MODES:
+        raise ValueError(f"unknown buffer mode {mode!r}, expected one of {', '.join(BUFFER_MODES)}")
+
+    packed = []
+    for a in args:
+        if isinstance(a, list) and all(type(x) is int for x in a):
+            try:
+                a = array.array('q', a)
+            except OverflowError:
+                pass
+            else:
+                a = memoryview(a) if mode == 'memoryview' else a
+        packed.append(a)
+    return tuple(packed)
+
+
+def buffer_input_generator(generate_input, mode):
+    """Wrap generate_input(n, rng) so its list[int] arguments come back as buffers."""
+    if mode is None or generate_input is None:
+        return generate_input
+
+    def generate_buffer_input(n, rng):
+        return to_buffer_args(generate_input(n, rng), mode)
+    return generate_buffer_input
+
+
+def buffer_option(args):
+    """Pop '--buffer array|memoryview' from a script's argument list (None when absent)"""
+    import sys
+
+    mode = option_value(args, '--buffer', str, None)
+    if mode is not None and mode not in BUFFER_MODES:
+        print(f"❌ --buffer must be one of: {', '.join(BUFFER_MODES)}")
+        sys.exit(1)
+    return mode
+
+
+def declared_complexity(path, kind='time'):
+    """Return the complexity a solution claims: class attribute, then complexity.json, then docstring header."""
+    import json
+    import re
+
+    module = load_solution(path)
+    declared = getattr(getattr(module, 'Solution', None), f"{kind}_complexity", None)
+
+    if not declared or declared == 'O(?)':
+        sidecar = os.path.join(os.path.dirname(os.path.abspath(path)), COMPLEXITY_SIDECAR)
+        try:
+            with open(sidecar, 'r', encoding='utf-8') as f:
+                declared = json.load(f).get(os.path.basename(path), {}).get(kind)
+        except (OSError, ValueError):
+            declared = None
+
+    if not declared or declared == 'O(?)':
+        label = 'Time' if kind == 'time' else 'Space'
+        m = re.search(rf'{label} Complexity:\s*(O\([^)]*\))', module.__doc__ or '')
+        declared = m.group(1) if m else None
+
+    if not declared or declared == 'O(?)':
+        return None
+    return normalize_complexity(declared)
+
+
+def normalize_complexity(label):
+    """Canonical spelling for comparisons: 'O(N)' -> 'O(n)', 'O(nlogn)' -> 'O(n log n)', 'O(n²)' -> 'O(n^2)'."""
+    import re
+
+    label = label.strip().replace('²', '^2').replace('*', ' ')
+    inner = label[2:-1] if label.startswith('O(') and label.endswith(')') else label
+    inner = inner.lower()
+    inner = re.sub(r'\s+', ' ', inner.replace('log', ' log ')).strip()
+    inner = re.sub(r'log ([a-z])', r'log \1', inner)
+    return f"O({inner})"
+
+
+def time_calls(func, args, warmups=1, repeats=7):
+    """Time func(*args) `repeats` times after `warmups` untimed runs, return nanosecond timings.
+
+    Every run gets a fresh copy of the arguments (copied outside the timed region) and the
+    garbage collector is paused while timing.
+    """
+    import gc
+    import time
+
+    for _ in range(warmups):
+        func(*copy_args(args))
+
+    timings = []
+    for _ in range(repeats):
+        run_args = copy_args(args)
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            start = time.perf_counter_ns()
+            func(*run_args)
+            timings.append(time.perf_counter_ns() - start)
+        finally:
+            if gc_enabled:
+                gc.enable()
+    return timings
+
+
+def timing_stats(timings):
+    """Summarize nanosecond timings as milliseconds: median, p95 (nearest rank), min and max."""
+    ordered = sorted(timings)
+    count = len(ordered)
+    middle = count // 2
+    median = ordered[middle] if count % 2 else (ordered[middle - 1] + ordered[middle]) / 2
+    p95 = ordered[max(0, math.ceil(0.95 * count) - 1)]
+    return {
+        'median_ms': median / 1e6,
+        'p95_ms': p95 / 1e6,
+        'min_ms': ordered[0] / 1e6,
+        'max_ms': ordered[-1] / 1e6,
+        'runs': count,
+    }
+
+
+COMPLEXITY_MODELS = [
+    ('O(1)', lambda n: 1.0),
+    ('O(log n)', lambda n: math.log2(n)),
+    ('O(n)', lambda n: float(n)),
+    ('O(n log n)', lambda n: n * math.log2(n)),
+    ('O(n^2)', lambda n: float(n) * n),
+]
+
+
+def fit_complexity(samples):
+    """Fit (n, cost) samples against COMPLEXITY_MODELS.
+
+    Each model cost = c * f(n) is fitted by least squares on the relative error, so small and
+    large sizes weigh equally. Returns (best_label, confidence, slope, residuals) where
+    confidence = 1 - best_residual / runner_up_residual (0 = indistinguishable, 1 = clear
+    winner) and slope is the log-log growth exponent.
+    """
+    samples = [(n, max(cost, 1)) for n, cost in samples]
+    residuals = {}
+    for label, model in COMPLEXITY_MODELS:
+        ratios = [model(n) / cost for n, cost in samples]
+        scale = sum(ratios) / sum(r * r for r in ratios)
+        residuals[label] = sum((scale * r - 1) ** 2 for r in ratios) / len(ratios)
+
+    ranked = sorted(residuals, key=residuals.get)
+    best, runner_up = ranked[0], ranked[1]
+    confidence = 1.0 - residuals[best] / residuals[runner_up] if residuals[runner_up] else 1.0
+
+    xs = [math.log(n) for n, _ in samples]
+    ys = [math.log(cost) for _, cost in samples]
+    mean_x, mean_y = sum(xs) / len(xs), sum(ys) / len(ys)
+    var_x = sum((x - mean_x) ** 2 for x in xs)
+    slope = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / var_x if var_x else 0.0
+
+    return best, confidence, slope, residuals
+
+
+def measure_time_complexity(func, generate_input, min_power=10, max_power=20, repeats=3,
+                            seed=0, size_time_limit=1.0):
+    """Empirically estimate the time complexity of func.
+
+    Runs func on generated inputs of size n = 2^min_power .. 2^max_power, keeping the fastest of
+    `repeats` runs per size (timed with perf_counter_ns, GC paused). Growth stops early once a
+    single run exceeds size_time_limit seconds, so quadratic code still finishes quickly.
+    Returns a dict with the best-fit 'complexity', 'confidence', 'slope' and raw 'samples'.
+    """
+    import gc
+    import random
+    import time
+
+    samples = []
+    for power in range(min_power, max_power + 1):
+        n = 2 ** power
+        args = generate_input(n, random.Random(seed * 1_000_003 + n))
+        best = None
+        for _ in range(repeats):
+            run_args = copy_args(args)
+            gc_enabled = gc.isenabled()
+            gc.disable()
+            try:
+                start = time.perf_counter_ns()
+                func(*run_args)
+                elapsed = time.perf_counter_ns() - start
+            finally:
+                if gc_enabled:
+                    gc.enable()
+            best = elapsed if best is None else min(best, elapsed)
+        samples.append((n, best))
+        if best > size_time_limit * 1e9:
+            break
+
+    if len(samples) < 3:
+        return {'complexity': 'O(?)', 'confidence': 0.0, 'slope': 0.0, 'samples': samples, 'residuals': {}}
+
+    complexity, confidence, slope, residuals = fit_complexity(samples)
+    return {
+        'complexity': complexity,
+        'confidence': confidence,
+        'slope': slope,
+        'samples': samples,
+        'residuals': residuals,
+    }
+
+
+def peak_memory(func, args):
+    """Peak bytes allocated by one func(*args) call (tracemalloc; arguments are copied beforehand)."""
+    import tracemalloc
+
+    args = copy_args(args)
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        func(*args)
+        peak = tracemalloc.get_traced_memory()[1] - baseline
+    finally:
+        tracemalloc.stop()
+    return max(peak, 0)
+
+
+def measure_space_complexity(func, generate_input, min_power=10, max_power=16, seed=0):
+    """Empirically estimate the extra memory func allocates, using tracemalloc.
+
+    The input is generated before tracing starts, so only allocations made by the call itself
+    (including its return value) count. Records the peak traced bytes per size
+    n = 2^min_power .. 2^max_power and fits them like measure_time_complexity.
+    """
+    import random
+
+    samples = []
+    for power in range(min_power, max_power + 1):
+        n = 2 ** power
+        args = generate_input(n, random.Random(seed * 1_000_003 + n))
+        samples.append((n, peak_memory(func, args)))
+
+    complexity, confidence, slope, residuals = fit_complexity(samples)
+    return {
+        'complexity': complexity,
+        'confidence': confidence,
+        'slope': slope,
+        'samples': samples,
+        'residuals': residuals,
+    }
+
+
+# --- Optional NumPy acceleration (alt*_numpy-python.py) ---
+
+# Buffer-backed inputs (ndarray, array.array, memoryview) are vectorized from this length on; Python
+# lists always take the pure-Python path, since boxing ints into and out of an ndarray costs more
+# than vectorizing saves
+VECTORIZE_THRESHOLD = 128
+
+
+@functools.lru_cache(maxsize=None)
+def _numpy():
+    """The numpy module, or None when it is not installed (imported on first use only)."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def should_vectorize(nums):
+    """True when NumPy is installed and nums is a buffer-backed sequence of VECTORIZE_THRESHOLD+ items."""
+    return not isinstance(nums, list) and len(nums) >= VECTORIZE_THRESHOLD and _numpy() is not None
+
+
+def as_ndarray(nums):
+    """Zero-copy (and, for writable buffers, writable) ndarray view of a buffer-backed sequence."""
+    np = _numpy()
+    if isinstance(nums, np.ndarray):
+        return nums
+    view = memoryview(nums)
+    return np.frombuffer(view, dtype=view.format)
+
+
+def check_numpy_path(path, solution, args):
+    """Test helper: solve() on int64 buffers must match _solve_python() on lists.
+
+    args should hold at least VECTORIZE_THRESHOLD elements so the NumPy path runs. Outputs are
+    compared with canonical_output; returns False (nothing checked) without NumPy.
+    """
+    if _numpy() is None:
+        return False
+    buffer_args = to_buffer_args(copy_args(args), 'array')
+    list_args = copy_args(args)
+    vectorized = canonical_output(path, buffer_args, solution.solve(*buffer_args))
+    looped = canonical_output(path, list_args, solution._solve_python(*list_args))
+    assert vectorized == looped, f"NumPy path disagrees with the pure-Python path: {vectorized!r} != {looped!r}"
+    return True
+
+
+# --- Binary test vectors (problems/*/vectors/*.vec) ---
+#
+# Layout (header and argument table little-endian):
+#   header   8s magic b'LCVECTOR', u16 version, u16 argument count, u32 payload byte order
+#            (0 little, 1 big), i64 size, i64 seed
+#   args     per argument: u8 kind, 7 pad bytes, u64 payload offset, u64 payload length
+#   payloads int64 sequence (length = elements), int64 scalar (length 1) or UTF-8 text (length =
+#            bytes), each starting on an 8-byte boundary; int64 payloads are in the writer's native
+#            byte order (array.tofile / memoryview.cast), so a machine of the other order refuses them
+# Files are mapped with mmap.ACCESS_COPY: int64 sequences reach the solution as writable
+# memoryview('q') views over the mapping, so loading costs nothing up front and in-place writes go
+# to private copy-on-write pages, never back to the file.
+
+VECTOR_DIR = 'vectors'
+VECTOR_SUFFIX = '.vec'
+_VECTOR_MAGIC = b'LCVECTOR'
+_VECTOR_VERSION = 1
+_VECTOR_INT_SEQUENCE, _VECTOR_INT, _VECTOR_TEXT = 1, 2, 3
+_VECTOR_BYTE_ORDERS = ('little', 'big')
+
+
+def _vector_structs():
+    import struct
+    return struct.Struct('<8sHHIqq'), struct.Struct('<B7xQQ')
+
+
+def write_test_vector(path, args, size=0, seed=0):
+    """Write one argument tuple as a binary test vector (atomically); return the file size in bytes.
+
+    Supported arguments: int sequences (list / array / memoryview / ndarray, packed as int64), ints
+    and strings. Anything else raises TypeError.
+    """
+    import array
+    import sys
+
+    header, arg_entry = _vector_structs()
+    payloads = []
+    for value in args:
+        if isinstance(value, str):
+            payloads.append((_VECTOR_TEXT, value.encode('utf-8')))
+        elif isinstance(value, int) and not isinstance(value, bool):
+            payloads.append((_VECTOR_INT, array.array('q', [value])))
+        elif hasattr(value, '__len__') and not isinstance(value, (bytes, bytearray)):
+            packed = value if isinstance(value, array.array) and value.typecode == 'q' else array.array('q', value)
+            payloads.append((_VECTOR_INT_SEQUENCE, packed))
+        else:
+            raise TypeError(f"test vectors cannot store {type(value).__name__} arguments")
+
+    offset = header.size + arg_entry.size * len(payloads)
+    entries = []
+    for kind, payload in payloads:
+        offset += -offset % 8
+        nbytes = len(payload) * (1 if kind == _VECTOR_TEXT else 8)
+        entries.append((kind, offset, len(payload)))
+        offset += nbytes
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        byte_order = _VECTOR_BYTE_ORDERS.index(sys.byteorder)
+        f.write(header.pack(_VECTOR_MAGIC, _VECTOR_VERSION, len(payloads), byte_order, size, seed))
+        for entry in entries:
+            f.write(arg_entry.pack(*entry))
+        for (kind, payload), (_, start, _) in zip(payloads, entries):
+            f.write(b'\0' * (start - f.tell()))
+            if kind == _VECTOR_TEXT:
+                f.write(payload)
+            else:
+                payload.tofile(f)
+        end = f.tell()
+    os.replace(tmp_path, path)
+    return end
+
+
+class TestVector:
+    """A memory-mapped test vector; use as a context manager or call close().
+
+    Attributes: args (argument tuple for one call), size and seed (as recorded at generation).
+    Each instance has its own copy-on-write mapping, so open the file again for every run of an
+    in-place solution instead of copying args.
+    """
+
+    def __init__(self, path):
+        import mmap
+        import sys
+
+        header, arg_entry = _vector_structs()
+        self.path = path
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+        try:
+            # Truncated or foreign files raise ValueError, never struct.error or a short read
+            if len(self._mmap) < header.size:
+                raise ValueError(f"{path}: truncated header")
+            magic, version, count, byte_order, self.size, self.seed = header.unpack_from(self._mmap, 0)
+            if magic != _VECTOR_MAGIC or version != _VECTOR_VERSION:
+                raise ValueError(f"{path}: not a version {_VECTOR_VERSION} test vector")
+            if byte_order >= len(_VECTOR_BYTE_ORDERS) or _VECTOR_BYTE_ORDERS[byte_order] != sys.byteorder:
+                raise ValueError(f"{path}: payloads are not in this machine's byte order, regenerate the vector")
+            if len(self._mmap) < header.size + count * arg_entry.size:
+                raise ValueError(f"{path}: truncated argument table")
+
+            self._views = []
+            args = []
+            for index in range(count):
+                kind, offset, length = arg_entry.unpack_from(self._mmap, header.size + index * arg_entry.size)
+                if kind not in (_VECTOR_INT_SEQUENCE, _VECTOR_INT, _VECTOR_TEXT) or (kind == _VECTOR_INT and length != 1):
+                    raise ValueError(f"{path}: corrupt argument entry {index}")
+                if offset % 8:
+                    raise ValueError(f"{path}: argument {index} payload is not 8-byte aligned")
+                if offset + length * (1 if kind == _VECTOR_TEXT else 8) > len(self._mmap):
+                    raise ValueError(f"{path}: argument {index} runs past the end of the file")
+                if kind == _VECTOR_TEXT:
+                    # str has no buffer-backed form; decoding is the one copy a text argument costs
+                    args.append(self._mmap[offset:offset + length].decode('utf-8'))
+                    continue
+                raw = memoryview(self._mmap)[offset:offset + 8 * length]
+                view = raw.cast('q')
+                self._views += [raw, view]
+                args.append(view if kind == _VECTOR_INT_SEQUENCE else view[0])
+            self.args = tuple(args)
+        except Exception:
+            self.close()
+            raise
+
+    def close(self):
+        """Release the views and unmap.
+
+        The memoryviews in args are released, so using them afterwards raises ValueError; views
+        derived from them (slices, np.frombuffer arrays) stay valid and keep the mapping alive.
+        """
+        for view in reversed(getattr(self, '_views', [])):
+            view.release()
+        self._views = []
+        try:
+            self._mmap.close()
+        except BufferError:
+            pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def get_test_vectors(path):
+    """Sorted .vec files in the vectors/ folder of a solution file's problem."""
+    vector_dir = os.path.join(os.path.dirname(os.path.abspath(path)), VECTOR_DIR)
+    if not os.path.isdir(vector_dir):
+        return []
+    return sorted(
+        os.path.join(vector_dir, name) for name in os.listdir(vector_dir) if name.endswith(VECTOR_SUFFIX)
+    )
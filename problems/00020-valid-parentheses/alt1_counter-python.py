@@ -38,7 +38,11 @@ class Solution:
                     right_bracket = {'(': ')', '[': ']', '{': '}'}[char]
                 elif char != left_bracket:
                     return self._stack_method(s)  # 多種類型，改用堆疊
-        
+
+        # 沒有任何左括號：只有不含右括號時才有效
+        if left_bracket is None:
+            return not any(char in ')]}' for char in s)
+
         # 計數器邏輯
         for char in s:
             if char == left_bracket:
@@ -0,0 +1,171 @@
+"""
+20. Valid Parentheses - Alternative Solution: Streaming Validator
+https://leetcode.com/problems/valid-parentheses/
+
+Time Complexity: O(n)
+Space Complexity: O(d)，d 為最大巢狀深度（另加固定大小的讀取區塊）
+
+逐塊讀入字串、產生器或檔案，只保留尚未閉合的括號堆疊，並回報第一個出錯的位置；
+多 GB 的括號串流只需循序讀取一次，不必整個載入記憶體
+"""
+
+from functools import partial
+
+CLOSERS = {'(': ')', '[': ']', '{': '}'}
+DEFAULT_CHUNK_SIZE = 1 << 20  # bytes per read in validateFile
+
+
+class BracketStream:
+    """
+    增量括號驗證器：feed() 逐塊輸入，finish() 取得結果
+
+    Attributes:
+        offset: 已完整讀入的字元數
+        error: 第一個出錯的位置（尚未出錯時為 None）
+    """
+
+    def __init__(self):
+        self.stack = []  # 依序等待的右括號
+        self.offset = 0
+        self.error = None
+
+    def feed(self, chunk):
+        """讀入一塊字串，回傳目前為止是否仍有效；出錯後的輸入一律忽略"""
+        if self.error is not None:
+            return False
+
+        # 快速掃描不記錄位置；先保存這塊最多可能彈出的堆疊尾端，出錯時還原後再逐字定位（每個串流最多一次）
+        depth = len(self.stack)
+        saved = self.stack[-len(chunk):] if chunk else []
+        if self._scan(chunk):
+            self.offset += len(chunk)
+            return True
+
+        del self.stack[depth - len(saved):]
+        self.stack.extend(saved)
+        self.error = self.offset + self._locate(chunk)
+        return False
+
+    def finish(self):
+        """
+        串流結束
+
+        Returns:
+            (是否有效, 第一個出錯位置)；有效時位置為 None，左括號未閉合時為串流結尾（缺少右括號的位置）
+        """
+        if self.error is None and self.stack:
+            self.error = self.offset
+        return self.error is None, self.error
+
+    def _scan(self, chunk):
+        stack = self.stack
+        push, pop, closer_for = stack.append, stack.pop, CLOSERS.get
+        for char in chunk:
+            closer = closer_for(char)
+            if closer is not None:  # 左括號
+                push(closer)
+            elif not stack or pop() != char:  # 多餘、不匹配的右括號或非括號字元
+                return False
+        return True
+
+    def _locate(self, chunk):
+        """與 _scan 相同，但回傳第一個出錯字元在這塊中的位置"""
+        stack = self.stack
+        for i, char in enumerate(chunk):
+            closer = CLOSERS.get(char)
+            if closer is not None:
+                stack.append(closer)
+            elif not stack or stack.pop() != char:
+                return i
+        raise AssertionError("_locate called on a valid chunk")
+
+
+class Solution:
+    def isValid(self, s: str) -> bool:
+        """整個字串視為單一區塊"""
+        return self.validateStream([s])[0]
+
+    def validateStream(self, chunks):
+        """
+        驗證字串或位元組區塊的可迭代物件（例如產生器），發現錯誤即停止讀取
+
+        Args:
+            chunks: str / bytes 區塊；位元組以 latin-1 解碼，一個位元組對應一個字元，位置即位元組偏移
+
+        Returns:
+            (是否有效, 第一個出錯位置或 None)
+        """
+        validator = BracketStream()
+        for chunk in chunks:
+            if isinstance(chunk, (bytes, bytearray)):
+                chunk = chunk.decode('latin-1')
+            if not validator.feed(chunk):
+                break
+        return validator.finish()
+
+    def validateFile(self, path, chunk_size=DEFAULT_CHUNK_SIZE):
+        """以固定大小區塊循序讀取檔案一次，回傳 (是否有效, 第一個出錯的位元組偏移或 None)"""
+        with open(path, 'rb') as f:
+            return self.validateStream(iter(partial(f.read, chunk_size), b''))
+
+
+def test_solution():
+    """測試函數"""
+    import os
+    import random
+    import tempfile
+
+    solution = Solution()
+
+    test_cases = [
+        ("()", True),
+        ("()[]{}", True),
+        ("(]", False),
+        ("([)]", False),
+        ("{[]}", True),
+        ("", True),
+        ("((", False),
+        ("))", False),
+    ]
+
+    for i, (s, expected) in enumerate(test_cases):
+        result = solution.isValid(s)
+        print(f"Test {i+1}: s='{s}' -> {result} (Expected: {expected})")
+        assert result == expected, f"Test {i+1} failed"
+
+    # 第一個出錯位置：多餘 / 不匹配的右括號、非括號字元；左括號未閉合時為串流結尾
+    offset_cases = [
+        ("([]{})", (True, None)),
+        ("(]", (False, 1)),
+        ("()())", (False, 4)),
+        ("([a])", (False, 2)),
+        ("()((()", (False, 6)),
+        ("(()", (False, 3)),
+    ]
+    for s, expected in offset_cases:
+        assert solution.validateStream([s]) == expected, f"{s!r}: {solution.validateStream([s])}"
+
+    # 區塊邊界不影響結果：任意切割的產生器與整串一致
+    rng = random.Random(0)
+    for _ in range(200):
+        s = ''.join(rng.choice('()[]{}') for _ in range(rng.randint(0, 12)))
+        if rng.random() < 0.5:
+            s = '([{' * 3 + s + '}])' * 3
+        cuts = sorted(rng.sample(range(len(s) + 1), min(3, len(s) + 1)))
+        chunks = (s[a:b] for a, b in zip([0] + cuts, cuts + [len(s)]))
+        assert solution.validateStream(chunks) == solution.validateStream([s]), f"chunking changed {s!r}"
+    print("Chunked generator input agrees with whole-string input")
+
+    # 檔案：小區塊讀取，位置為位元組偏移
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'brackets.txt')
+        with open(path, 'w', encoding='ascii') as f:
+            f.write('({[]})' * 1000 + ']' + '()' * 1000)
+        assert solution.validateFile(path, chunk_size=7) == (False, 6000)
+    print("File input reports the first offending byte offset")
+
+    print("All tests passed!")
+
+
+if __name__ == "__main__":
+    test_solution()
@@ -33,6 +33,40 @@ class Solution:
         return not stack
 
 
+def generate_input(n, rng):
+    """Random balanced bracket string of length n (even), the worst case for a full scan"""
+    pairs = {'(': ')', '[': ']', '{': '}'}
+    chars = []
+    stack = []
+    for remaining in range(n - n % 2, 0, -1):
+        if stack and (len(stack) == remaining or rng.random() < 0.5):
+            chars.append(pairs[stack.pop()])
+        else:
+            opening = rng.choice('([{')
+            stack.append(opening)
+            chars.append(opening)
+    return (''.join(chars),)
+
+
+def generate_stress_input(n, rng):
+    """Mostly-invalid bracket strings: random characters, or a balanced string with one edit"""
+    if rng.random() < 0.5:
+        return (''.join(rng.choice('()[]{}') for _ in range(n)),)
+    chars = list(generate_input(n, rng)[0])
+    if chars:
+        chars[rng.randrange(len(chars))] = rng.choice('()[]{}')
+    return (''.join(chars),)
+
+
+def brute_force(s):
+    """Oracle: repeatedly delete adjacent matched pairs, O(n^2)"""
+    previous = None
+    while previous != s:
+        previous = s
+        s = s.replace('()', '').replace('[]', '').replace('{}', '')
+    return s == ''
+
+
 def test_solution():
     """測試函數"""
     solution = Solution()
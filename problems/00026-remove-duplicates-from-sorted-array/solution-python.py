@@ -22,9 +22,27 @@ class Solution:
         return count
 
 
+def generate_input(n, rng):
+    """Sorted array of n values in [-100, 100] (many duplicates)"""
+    return (sorted(rng.choices(range(-100, 101), k=n)),)
+
+
+def canonical_output(args, result):
+    """Only k and the first k elements are judged"""
+    return result, list(args[0][:result])
+
+
+def brute_force(nums):
+    """Oracle: write the sorted distinct values to the front (element-wise, so buffers work too)"""
+    unique = sorted(set(nums))
+    for i, x in enumerate(unique):
+        nums[i] = x
+    return len(unique)
+
+
 import sys as _sys, pathlib as _pl
 _sys.path.insert(0, str(_pl.Path(__file__).parents[2]))
-from lc_utils import analyze_complexity as _analyze_complexity
+from lc_utils import record_complexity as _record_complexity
 
 
 def test_solution():
@@ -56,17 +74,16 @@ def test_solution():
         print(f"Test {i+1}: input={input_data} -> {result} (Expected: {expected})")
         assert result == expected, f"Test {i+1} failed"
 
-    # Auto-analyze and update complexity in file header
-    import re as _re, pathlib as _pl
-    tc, sc = _analyze_complexity(Solution.solve)
-    _path = _pl.Path(__file__)
-    _text = _path.read_text(encoding='utf-8')
-    _text = _re.sub(r'^( {4}time_complexity = ")[^"]*"', r'\g<1>' + tc + '"', _text, flags=_re.MULTILINE)
-    _text = _re.sub(r'^( {4}space_complexity = ")[^"]*"', r'\g<1>' + sc + '"', _text, flags=_re.MULTILINE)
-    _text = _re.sub(r'Time Complexity: O\([^)]*\)', 'Time Complexity: ' + tc, _text)
-    _text = _re.sub(r'Space Complexity: O\([^)]*\)', 'Space Complexity: ' + sc, _text)
-    _path.write_text(_text, encoding='utf-8')
-    print('✅ Complexity updated → Time: %s, Space: %s' % (tc, sc))
+    # The in-place loop only indexes and assigns, so int64 buffers (array.array / memoryview) work too
+    from array import array
+    for nums in (array('q', [0, 0, 1, 1, 1, 2, 2, 3, 3, 4]), memoryview(array('q', [0, 0, 1, 1, 1, 2, 2, 3, 3, 4]))):
+        k = solution.solve(nums)
+        assert k == 5 and list(nums[:k]) == [0, 1, 2, 3, 4], f"{type(nums).__name__} input failed"
+    print("array.array / memoryview inputs pass")
+
+    # Record analyzed complexity in complexity.json (the source file is never rewritten)
+    tc, sc = _record_complexity(__file__, Solution.solve)
+    print('✅ Complexity → Time: %s, Space: %s' % (tc, sc))
 
     print("All tests passed!")
 
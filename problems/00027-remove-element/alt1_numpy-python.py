@@ -0,0 +1,62 @@
+"""
+27. Remove Element - Alternative Solution: NumPy boolean mask
+https://leetcode.com/problems/remove-element/
+
+Time Complexity: O(n)
+Space Complexity: O(n)
+
+以布林遮罩 nums != val 篩出保留的元素，直接寫回緩衝區前段；需要 O(n) 暫存，Python list 維持原地雙指針
+"""
+
+import sys as _sys, pathlib as _pl
+_sys.path.insert(0, str(_pl.Path(__file__).parents[2]))
+from lc_utils import VECTORIZE_THRESHOLD, should_vectorize, as_ndarray, check_numpy_path
+
+
+class Solution:
+    def solve(self, nums, val):
+        if should_vectorize(nums):
+            return self._solve_numpy(nums, val)
+        return self._solve_python(nums, val)
+
+    def _solve_python(self, nums, val):
+        k = 0
+        for i in range(len(nums)):
+            if nums[i] != val:
+                nums[k] = nums[i]
+                k += 1
+        return k
+
+    def _solve_numpy(self, nums, val):
+        values = as_ndarray(nums)
+        kept = values[values != val]  # boolean indexing copies, so writing back below is safe
+        k = int(kept.size)
+        values[:k] = kept
+        return k
+
+
+def test_solution():
+    """測試函數"""
+    solution = Solution()
+
+    test_cases = [
+        (([3, 2, 2, 3], 3), (2, [2, 2])),
+        (([0, 1, 2, 2, 3, 0, 4, 2], 2), (5, [0, 0, 1, 3, 4])),
+    ]
+
+    for i, ((nums, val), expected) in enumerate(test_cases):
+        k = solution.solve(nums, val)
+        result = (k, sorted(nums[:k]))
+        print(f"Test {i+1}: nums={nums[:k]}, k={k} (Expected: {expected})")
+        assert result == expected, f"Test {i+1} failed"
+
+    import random
+    rng = random.Random(0)
+    if check_numpy_path(__file__, solution, ([rng.randint(0, 50) for _ in range(4 * VECTORIZE_THRESHOLD)], 7)):
+        print("NumPy (array.array input) and pure-Python paths agree")
+
+    print("All tests passed!")
+
+
+if __name__ == "__main__":
+    test_solution()
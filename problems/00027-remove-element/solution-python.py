@@ -2,8 +2,8 @@
 27. Remove Element
 https://leetcode.com/problems/remove-element/
 
-Time Complexity: O(?)
-Space Complexity: O(?)
+Time Complexity: O(n)
+Space Complexity: O(1)
 
 Tags: Array, Two Pointers
 """
@@ -19,6 +19,24 @@ class Solution:
         return k
 
 
+def generate_input(n, rng):
+    """(nums, val) with n values in [0, 50]"""
+    return (rng.choices(range(51), k=n), rng.randint(0, 50))
+
+
+def canonical_output(args, result):
+    """Only k and the first k elements are judged, in any order"""
+    return result, sorted(args[0][:result])
+
+
+def brute_force(nums, val):
+    """Oracle: filter into a new list and copy it back (element-wise, so buffers work too)"""
+    kept = [x for x in nums if x != val]
+    for i, x in enumerate(kept):
+        nums[i] = x
+    return len(kept)
+
+
 def test_solution():
     solution = Solution()
     
@@ -32,6 +50,13 @@ def test_solution():
         result = solution.solve(nums, val)
         print(f"Test {i+1}: nums={nums[:result]}, k={result} (Expected k: {expected})")
         assert result == expected, f"Test {i+1} failed"
+
+    # The in-place loop only indexes and assigns, so int64 buffers (array.array / memoryview) work too
+    from array import array
+    for nums in (array('q', [0, 1, 2, 2, 3, 0, 4, 2]), memoryview(array('q', [0, 1, 2, 2, 3, 0, 4, 2]))):
+        k = solution.solve(nums, 2)
+        assert k == 5 and sorted(nums[:k]) == [0, 0, 1, 3, 4], f"{type(nums).__name__} input failed"
+    print("array.array / memoryview inputs pass")
     
     print("All tests passed!")
 
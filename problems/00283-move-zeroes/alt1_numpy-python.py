@@ -0,0 +1,62 @@
+"""
+283. Move Zeroes - Alternative Solution: NumPy stable partition
+https://leetcode.com/problems/move-zeroes/
+
+Time Complexity: O(n)
+Space Complexity: O(n)
+
+以遮罩取出非零元素（保持相對順序）寫回緩衝區前段、其餘補 0；需要 O(n) 暫存，Python list 維持原地雙指針
+"""
+
+import sys as _sys, pathlib as _pl
+_sys.path.insert(0, str(_pl.Path(__file__).parents[2]))
+from lc_utils import VECTORIZE_THRESHOLD, should_vectorize, as_ndarray, check_numpy_path
+
+
+class Solution:
+    def solve(self, nums):
+        if should_vectorize(nums):
+            return self._solve_numpy(nums)
+        return self._solve_python(nums)
+
+    def _solve_python(self, nums):
+        k = 0
+        for i in range(len(nums)):
+            if nums[i] != 0:
+                nums[k], nums[i] = nums[i], nums[k]
+                k += 1
+        return nums
+
+    def _solve_numpy(self, nums):
+        values = as_ndarray(nums)
+        non_zero = values[values != 0]  # boolean indexing copies and keeps the relative order
+        k = int(non_zero.size)
+        values[:k] = non_zero
+        values[k:] = 0
+        return nums
+
+
+def test_solution():
+    """測試函數"""
+    solution = Solution()
+
+    test_cases = [
+        ([0, 1, 0, 3, 12], [1, 3, 12, 0, 0]),
+        ([0], [0]),
+    ]
+
+    for i, (input_data, expected) in enumerate(test_cases):
+        result = solution.solve(input_data)
+        print(f"Test {i+1}: input={input_data} -> {result} (Expected: {expected})")
+        assert result == expected, f"Test {i+1} failed"
+
+    import random
+    rng = random.Random(0)
+    if check_numpy_path(__file__, solution, ([rng.choice([0, 0, 0, -3, 1, 2, 6]) for _ in range(4 * VECTORIZE_THRESHOLD)],)):
+        print("NumPy (array.array input) and pure-Python paths agree")
+
+    print("All tests passed!")
+
+
+if __name__ == "__main__":
+    test_solution()
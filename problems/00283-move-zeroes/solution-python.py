@@ -21,9 +21,26 @@ class Solution:
         return nums
 
 
+def generate_input(n, rng):
+    """n values in [-3, 6], roughly 30% zeros"""
+    return (rng.choices([0, 0, 0, -3, -2, -1, 1, 2, 4, 6], k=n),)
+
+
+def canonical_output(args, result):
+    """Judged in place: only the final contents of nums matter"""
+    return list(args[0])
+
+
+def brute_force(nums):
+    """Oracle: stable partition into non-zeros then zeros (element-wise, so buffers work too)"""
+    kept = [x for x in nums if x != 0]
+    for i, x in enumerate(kept + [0] * (len(nums) - len(kept))):
+        nums[i] = x
+
+
 import sys as _sys, pathlib as _pl
 _sys.path.insert(0, str(_pl.Path(__file__).parents[2]))
-from lc_utils import analyze_complexity as _analyze_complexity
+from lc_utils import record_complexity as _record_complexity
 
 
 def test_solution():
@@ -55,17 +72,16 @@ def test_solution():
         print(f"Test {i+1}: input={input_data} -> {result} (Expected: {expected})")
         assert result == expected, f"Test {i+1} failed"
 
-    # Auto-analyze and update complexity in file header
-    import re as _re, pathlib as _pl
-    tc, sc = _analyze_complexity(Solution.solve)
-    _path = _pl.Path(__file__)
-    _text = _path.read_text(encoding='utf-8')
-    _text = _re.sub(r'^( {4}time_complexity = ")[^"]*"', r'\g<1>' + tc + '"', _text, flags=_re.MULTILINE)
-    _text = _re.sub(r'^( {4}space_complexity = ")[^"]*"', r'\g<1>' + sc + '"', _text, flags=_re.MULTILINE)
-    _text = _re.sub(r'Time Complexity: O\([^)]*\)', 'Time Complexity: ' + tc, _text)
-    _text = _re.sub(r'Space Complexity: O\([^)]*\)', 'Space Complexity: ' + sc, _text)
-    _path.write_text(_text, encoding='utf-8')
-    print('✅ Complexity updated → Time: %s, Space: %s' % (tc, sc))
+    # The in-place swaps only index and assign, so int64 buffers (array.array / memoryview) work too
+    from array import array
+    for nums in (array('q', [0, 1, 0, 3, 12]), memoryview(array('q', [0, 1, 0, 3, 12]))):
+        solution.solve(nums)
+        assert list(nums) == [1, 3, 12, 0, 0], f"{type(nums).__name__} input failed"
+    print("array.array / memoryview inputs pass")
+
+    # Record analyzed complexity in complexity.json (the source file is never rewritten)
+    tc, sc = _record_complexity(__file__, Solution.solve)
+    print('✅ Complexity → Time: %s, Space: %s' % (tc, sc))
 
     print("All tests passed!")
 
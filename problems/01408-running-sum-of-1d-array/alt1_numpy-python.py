@@ -0,0 +1,56 @@
+"""
+1408. Running Sum of 1d Array - Alternative Solution: NumPy cumsum
+https://leetcode.com/problems/running-sum-of-1d-array/
+
+Time Complexity: O(n)
+Space Complexity: O(n)
+
+輸入為 ndarray / array.array / memoryview 等緩衝區時以零拷貝檢視做 np.cumsum；Python list 維持迴圈
+"""
+
+from itertools import accumulate
+
+import sys as _sys, pathlib as _pl
+_sys.path.insert(0, str(_pl.Path(__file__).parents[2]))
+from lc_utils import VECTORIZE_THRESHOLD, should_vectorize, as_ndarray, check_numpy_path
+
+
+class Solution:
+    def solve(self, nums):
+        if should_vectorize(nums):
+            return self._solve_numpy(nums)
+        return self._solve_python(nums)
+
+    def _solve_python(self, nums):
+        return list(accumulate(nums))
+
+    def _solve_numpy(self, nums):
+        # int64 holds every prefix sum under LeetCode's bounds (n <= 1000, |nums[i]| <= 10^6)
+        return as_ndarray(nums).cumsum(dtype='int64')
+
+
+def test_solution():
+    """測試函數"""
+    solution = Solution()
+
+    test_cases = [
+        ([1, 2, 3, 4], [1, 3, 6, 10]),
+        ([1, 1, 1, 1, 1], [1, 2, 3, 4, 5]),
+        ([3, 1, 2, 10, 1], [3, 4, 6, 16, 17]),
+    ]
+
+    for i, (input_data, expected) in enumerate(test_cases):
+        result = solution.solve(input_data)
+        print(f"Test {i+1}: input={input_data} -> {result} (Expected: {expected})")
+        assert result == expected, f"Test {i+1} failed"
+
+    import random
+    rng = random.Random(0)
+    if check_numpy_path(__file__, solution, ([rng.randint(-10**6, 10**6) for _ in range(4 * VECTORIZE_THRESHOLD)],)):
+        print("NumPy (array.array input) and pure-Python paths agree")
+
+    print("All tests passed!")
+
+
+if __name__ == "__main__":
+    test_solution()
@@ -0,0 +1,41 @@
+"""
+1408. Running Sum of 1d Array - Alternative Solution: Preallocated list
+https://leetcode.com/problems/running-sum-of-1d-array/
+
+Time Complexity: O(n)
+Space Complexity: O(n)
+
+先配置 [0] * n 再以索引寫入，避免 append 重新配置；但在 CPython 中索引寫入加上 enumerate
+在每個實測規模都比 append 更慢（見 README 實測對比），保留作為對照
+"""
+
+class Solution:
+    def solve(self, nums):
+        running_sum = [0] * len(nums)
+        current_sum = 0
+        for i, num in enumerate(nums):
+            current_sum += num
+            running_sum[i] = current_sum
+        return running_sum
+
+
+def test_solution():
+    """測試函數"""
+    solution = Solution()
+
+    test_cases = [
+        ([1, 2, 3, 4], [1, 3, 6, 10]),
+        ([1, 1, 1, 1, 1], [1, 2, 3, 4, 5]),
+        ([3, 1, 2, 10, 1], [3, 4, 6, 16, 17]),
+    ]
+
+    for i, (input_data, expected) in enumerate(test_cases):
+        result = solution.solve(input_data)
+        print(f"Test {i+1}: input={input_data} -> {result} (Expected: {expected})")
+        assert result == expected, f"Test {i+1} failed"
+
+    print("All tests passed!")
+
+
+if __name__ == "__main__":
+    test_solution()
@@ -8,16 +8,23 @@ Space Complexity: O(N)
 Tags: list
 """
 
+from itertools import accumulate
+
+
 class Solution:
-    def solve(self, param):
-
-        list_running_sum = []
-        current_sum = 0
-        for num in param:
-            current_sum += num
-            list_running_sum.append(current_sum)
-        return list_running_sum
-        
+    def solve(self, nums):
+        # accumulate runs the running sum in C, ahead of an append loop at every size up to 10^6 (README)
+        return list(accumulate(nums))
+
+
+def generate_input(n, rng):
+    """n values in [-10^6, 10^6]"""
+    return (rng.choices(range(-10**6, 10**6 + 1), k=n),)
+
+
+def brute_force(nums):
+    """Oracle: sum every prefix from scratch, O(n^2)"""
+    return [sum(nums[:i + 1]) for i in range(len(nums))]
 
 
 def test_solution():
@@ -0,0 +1,58 @@
+"""
+1470. Shuffle the Array - Alternative Solution: NumPy reshape interleave
+https://leetcode.com/problems/shuffle-the-array/
+
+Time Complexity: O(n)
+Space Complexity: O(n)
+
+把 nums 視為 2 x n 矩陣，轉置後攤平即得 [x1, y1, x2, y2, ...]；只對緩衝區輸入向量化，Python list 維持迴圈
+"""
+
+import sys as _sys, pathlib as _pl
+_sys.path.insert(0, str(_pl.Path(__file__).parents[2]))
+from lc_utils import VECTORIZE_THRESHOLD, should_vectorize, as_ndarray, check_numpy_path
+
+
+class Solution:
+    def solve(self, nums, n):
+        if should_vectorize(nums):
+            return self._solve_numpy(nums, n)
+        return self._solve_python(nums, n)
+
+    def _solve_python(self, nums, n):
+        output = [0] * (2 * n)
+        output[::2] = nums[:n]
+        output[1::2] = nums[n:2 * n]
+        return output
+
+    def _solve_numpy(self, nums, n):
+        # Viewed as a 2 x n matrix, the transpose flattened in row order is x1, y1, x2, y2, ...
+        return as_ndarray(nums)[:2 * n].reshape(2, n).T.ravel()
+
+
+def test_solution():
+    """測試函數"""
+    solution = Solution()
+
+    test_cases = [
+        (([2, 5, 1, 3, 4, 7], 3), [2, 3, 5, 4, 1, 7]),
+        (([1, 2, 3, 4, 4, 3, 2, 1], 4), [1, 4, 2, 3, 3, 2, 4, 1]),
+        (([1, 1, 2, 2], 2), [1, 2, 1, 2]),
+    ]
+
+    for i, (input_data, expected) in enumerate(test_cases):
+        result = solution.solve(*input_data)
+        print(f"Test {i+1}: input={input_data} -> {result} (Expected: {expected})")
+        assert result == expected, f"Test {i+1} failed"
+
+    import random
+    rng = random.Random(0)
+    n = 2 * VECTORIZE_THRESHOLD
+    if check_numpy_path(__file__, solution, ([rng.randint(1, 1000) for _ in range(2 * n)], n)):
+        print("NumPy (array.array input) and pure-Python paths agree")
+
+    print("All tests passed!")
+
+
+if __name__ == "__main__":
+    test_solution()
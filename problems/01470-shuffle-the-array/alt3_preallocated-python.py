@@ -0,0 +1,39 @@
+"""
+1470. Shuffle the Array - Alternative Solution: Preallocated list
+https://leetcode.com/problems/shuffle-the-array/
+
+Time Complexity: O(n)
+Space Complexity: O(n)
+
+先配置 [0] * 2n 再以索引寫入 output[2i] / output[2i + 1]；在 CPython 中每次索引運算
+在每個實測規模都比 append 更慢（見 README 實測對比），保留作為對照
+"""
+
+class Solution:
+    def solve(self, nums, n):
+        output = [0] * (2 * n)
+        for i in range(n):
+            output[2 * i] = nums[i]
+            output[2 * i + 1] = nums[i + n]
+        return output
+
+
+def test_solution():
+    """測試函數"""
+    solution = Solution()
+
+    test_cases = [
+        ([2, 5, 1, 3, 4, 7], [2, 3, 5, 4, 1, 7]),
+        ([1, 2, 3, 4, 4, 3, 2, 1], [1, 4, 2, 3, 3, 2, 4, 1]),
+    ]
+
+    for i, (input_data, expected) in enumerate(test_cases):
+        result = solution.solve(input_data, len(input_data) // 2)
+        print(f"Test {i+1}: input={input_data} -> {result} (Expected: {expected})")
+        assert result == expected, f"Test {i+1} failed"
+
+    print("All tests passed!")
+
+
+if __name__ == "__main__":
+    test_solution()
@@ -10,13 +10,24 @@ Tags: Array
 
 class Solution:
     def solve(self, nums, n):
-        output = []
-        for i in range(n):
-            output.append(nums[i])
-            output.append(nums[i + n])
+        # Two slice assignments copy each half in C, ahead of an append loop at every size up to 10^6 (README)
+        output = [0] * (2 * n)
+        output[::2] = nums[:n]
+        output[1::2] = nums[n:2 * n]
         return output
 
 
+def generate_input(n, rng):
+    """(nums, half) with 2 * (n // 2) values in [1, 1000]"""
+    half = max(1, n // 2)
+    return (rng.choices(range(1, 1001), k=2 * half), half)
+
+
+def brute_force(nums, n):
+    """Oracle: zip the two halves"""
+    return [x for pair in zip(nums[:n], nums[n:]) for x in pair]
+
+
 def test_solution():
     solution = Solution()
     
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Benchmark solutions on deterministic large inputs and track them against committed baselines
+Every variant of a problem runs on the same generated input (fixed seed), with warmup runs
+and repeated timed runs; median and p95 are reported and compared with benchmarks/baselines.json
+
+Usage: python scripts/bench.py [problem ...] [--size N] [--repeats N] [--warmups N] [--seed N]
+                               [--buffer array|memoryview] [--check] [--threshold RATIO]
+                               [--update-baseline] [--json PATH]
+Example: python scripts/bench.py 20                  # solution-python.py vs alt1_counter-python.py
+Example: python scripts/bench.py --check             # exit 1 if a median is 25% slower than its baseline
+Example: python scripts/bench.py --update-baseline   # record current timings as the new baselines
+Example: python scripts/bench.py 283 --buffer array  # list[int] inputs passed as array.array('q')
+"""
+
+import os
+import sys
+import json
+import random
+import platform
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from lc_utils import (
+    PROJECT_ROOT, discover_solution_files, load_solution, get_entry_point, option_value, buffer_option,
+    get_input_generator, buffer_input_generator, time_calls, timing_stats,
+)
+
+
+BASELINE_FILE = os.path.join(PROJECT_ROOT, 'benchmarks', 'baselines.json')
+DEFAULT_SIZE = 100_000
+DEFAULT_THRESHOLD = 1.25  # fail --check when median > baseline median * threshold
+
+
+def load_baselines(path=BASELINE_FILE):
+    """Load {'environment': {...}, 'results': {relative_path: stats}}"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {'environment': {}, 'results': {}}
+
+
+def save_baselines(baselines, path=BASELINE_FILE):
+    """Write baselines atomically with stable key order (small diffs under version control)"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(baselines, f, indent=2, sort_keys=True)
+        f.write('\n')
+    os.replace(tmp_path, path)
+
+
+def current_environment():
+    """Machine description stored next to baselines; timings only compare on like machines"""
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'machine': platform.machine(),
+        'system': platform.system(),
+    }
+
+
+def group_by_problem(files):
+    """{problem folder: [solution files]} preserving discovery order (primary solution first)"""
+    groups = {}
+    for path in files:
+        groups.setdefault(os.path.basename(os.path.dirname(path)), []).append(path)
+    return groups
+
+
+def result_key(relative_path, buffer=None):
+    """Baseline key: buffer-mode results are tracked separately from list-input ones"""
+    return f"{relative_path} [{buffer}]" if buffer else relative_path
+
+
+def bench_problem(paths, size, seed, warmups, repeats, buffer=None):
+    """Time every variant of one problem on the same generated input, return {result key: stats}"""
+    generator = buffer_input_generator(get_input_generator(paths[0]), buffer)
+    if generator is None:
+        return None
+
+    args = generator(size, random.Random(seed))
+
+    results = {}
+    for path in paths:
+        relative_path = os.path.relpath(path, os.path.join(PROJECT_ROOT, 'problems'))
+        func = get_entry_point(load_solution(path).Solution())
+        stats = timing_stats(time_calls(func, args, warmups, repeats))
+        stats['size'] = size
+        stats['seed'] = seed
+        stats['input'] = buffer or 'list'
+        results[result_key(relative_path, buffer)] = stats
+    return results
+
+
+def compare_to_baseline(stats, baseline, threshold):
+    """Return (ratio, regressed) of the current median against a baseline of the same input
+
+    The baseline must have been recorded at the same size and seed and with the same input kind
+    (list / array / memoryview); anything else measures a different input and is not compared.
+    """
+    if not baseline or not baseline.get('median_ms'):
+        return None, False
+    if any(baseline.get(field) != stats[field] for field in ('size', 'seed', 'input')):
+        return None, False
+    ratio = stats['median_ms'] / baseline['median_ms']
+    return ratio, ratio > threshold
+
+
+def print_problem(folder, results, baselines, threshold):
+    """Print one problem's variants, speedup over the primary solution and baseline deltas; return regressions"""
+    first = next(iter(results.values()))
+    print(f"\n🏁 {folder} (n = {first['size']:,}, {first['input']} inputs, seed {first['seed']}, "
+          f"{first['runs']} runs)")
+
+    # Speedup relative to the primary solution (first variant): 2.00x = twice as fast
+    primary = first['median_ms']
+    regressions = []
+    for key, stats in results.items():
+        speedup = primary / stats['median_ms'] if stats['median_ms'] else 1.0
+        line = (f"   {os.path.basename(key.split(' [')[0]):<32} median {stats['median_ms']:9.3f} ms   "
+                f"p95 {stats['p95_ms']:9.3f} ms   {speedup:5.2f}x")
+
+        ratio, regressed = compare_to_baseline(stats, baselines['results'].get(key), threshold)
+        if ratio is not None:
+            line += f"   baseline {(ratio - 1) * 100:+6.1f}%"
+            if regressed:
+                line += " ❌"
+                regressions.append(key)
+        print(line)
+    return regressions
+
+
+def main():
+    """Main function"""
+    args = sys.argv[1:]
+    size = option_value(args, '--size', int, DEFAULT_SIZE)
+    repeats = option_value(args, '--repeats', int, 7)
+    warmups = option_value(args, '--warmups', int, 1)
+    seed = option_value(args, '--seed', int, 0)
+    threshold = option_value(args, '--threshold', float, DEFAULT_THRESHOLD)
+    json_path = option_value(args, '--json', str, None)
+    buffer = buffer_option(args)
+    check = '--check' in args
+    update = '--update-baseline' in args
+    filters = [arg for arg in args if not arg.startswith('-')]
+
+    files = discover_solution_files(filters=filters)
+    if not files:
+        print("❌ No solution files found")
+        sys.exit(1)
+
+    baselines = load_baselines()
+    environment = current_environment()
+    if baselines['results'] and baselines.get('environment') != environment:
+        print(f"⚠️  Baselines were recorded on {baselines.get('environment')}, "
+              f"this machine is {environment}; comparisons are indicative only")
+
+    all_results = {}
+    regressions = []
+    for folder, paths in group_by_problem(files).items():
+        results = bench_problem(paths, size, seed, warmups, repeats, buffer)
+        if results is None:
+            print(f"\n⏭️  {folder}: no generate_input(n, rng), skipped")
+            continue
+        regressions += print_problem(folder, results, baselines, threshold)
+        all_results.update(results)
+
+    if json_path:
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump({'environment': environment, 'results': all_results}, f, indent=2, sort_keys=True)
+        print(f"\n📄 JSON results: {json_path}")
+
+    if update:
+        baselines['environment'] = environment
+        baselines['updated'] = datetime.now().strftime('%Y-%m-%d')
+        for key, stats in all_results.items():
+            baselines['results'][key] = {
+                field: round(value, 4) if isinstance(value, float) else value
+                for field, value in stats.items()
+            }
+        save_baselines(baselines)
+        print(f"\n💾 Updated {len(all_results)} baselines in {os.path.relpath(BASELINE_FILE, PROJECT_ROOT)}")
+    elif regressions:
+        print(f"\n❌ Slower than baseline by more than {(threshold - 1) * 100:.0f}%: {', '.join(regressions)}")
+        if check:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Head-to-head comparison of every solution variant of a problem
+Runs all variants on the same inputs of size 2^10 .. 2^16, checks that they agree on the output,
+records median time and peak memory per size (CSV plot data under benchmarks/compare/) and writes
+a summary table with the crossover point into the problem README's complexity section
+
+Usage: python scripts/compare-solutions.py [problem ...] [--min-power N] [--max-power N] [--repeats N] [--no-readme]
+                                           [--buffer array|memoryview]
+Example: python scripts/compare-solutions.py 20
+Example: python scripts/compare-solutions.py 20 --max-power 18 --no-readme
+Example: python scripts/compare-solutions.py 283 --buffer array   # -> benchmarks/compare/00283-move-zeroes-array.csv
+
+Buffer runs pass list[int] arguments as array.array('q') / memoryview; they get their own CSV and
+leave the README (which describes list inputs) untouched.
+"""
+
+import os
+import re
+import sys
+import csv
+import random
+import platform
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from lc_utils import (
+    PROJECT_ROOT, discover_solution_files, load_solution, get_entry_point, option_value, buffer_option,
+    get_input_generator, buffer_input_generator, canonical_output, copy_args, time_calls,
+    timing_stats, peak_memory,
+)
+
+
+COMPARE_DIR = os.path.join(PROJECT_ROOT, 'benchmarks', 'compare')
+README_START = '<!-- solution-comparison:start -->'
+README_END = '<!-- solution-comparison:end -->'
+COMPLEXITY_HEADINGS = ('## Complexity Analysis', '## 複雜度分析')
+TIE_MARGIN = 0.25  # variants within 25% of the fastest count as tied (bench.py's noise threshold)
+DEFAULT_REPEATS = 15  # timed calls per variant and size; fewer let the committed rankings flip between runs
+
+
+class OutputMismatch(Exception):
+    """Two variants returned different (canonical) outputs for the same input"""
+
+
+def compare_problem(paths, min_power, max_power, repeats, seed=0, buffer=None):
+    """Run every variant on each size, return rows of {'n', 'variant', 'median_ms', 'peak_kib'}
+
+    Raises OutputMismatch when a variant disagrees with the first one.
+    """
+    generator = buffer_input_generator(get_input_generator(paths[0]), buffer)
+    funcs = {os.path.basename(path): (path, get_entry_point(load_solution(path).Solution())) for path in paths}
+
+    rows = []
+    for power in range(min_power, max_power + 1):
+        n = 2 ** power
+        args = generator(n, random.Random(seed * 1_000_003 + n))
+
+        expected = None
+        for variant, (path, func) in funcs.items():
+            run_args = copy_args(args)
+            output = canonical_output(path, run_args, func(*run_args))
+            if expected is None:
+                expected, reference = output, variant
+            elif output != expected:
+                raise OutputMismatch(f"{variant} disagrees with {reference} at n = {n:,} (seed {seed})")
+
+        # Round-robin: drift in machine load then hits every variant alike instead of whichever
+        # one happened to be timed during it, so equivalent variants rank consistently
+        timings = {variant: [] for variant in funcs}
+        for _ in range(repeats):
+            for variant, (path, func) in funcs.items():
+                timings[variant] += time_calls(func, args, warmups=0, repeats=1)
+
+        for variant, (path, func) in funcs.items():
+            stats = timing_stats(timings[variant])
+            rows.append({
+                'n': n,
+                'variant': variant,
+                'median_ms': round(stats['median_ms'], 4),
+                'peak_kib': round(peak_memory(func, args) / 1024, 1),
+            })
+    return rows
+
+
+def write_csv(folder, rows, buffer=None):
+    """Write long-format plot data: one row per (n, variant)"""
+    os.makedirs(COMPARE_DIR, exist_ok=True)
+    path = os.path.join(COMPARE_DIR, f"{folder}-{buffer}.csv" if buffer else f"{folder}.csv")
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=['n', 'variant', 'median_ms', 'peak_kib'])
+        writer.writeheader()
+        writer.writerows(rows)
+    return path
+
+
+def fastest_by_size(rows):
+    """[(n, fastest variant)] in size order
+
+    Variants within TIE_MARGIN of the best time count as tied and the earliest listed one wins
+    (the primary solution first), so timing noise between equivalent variants does not read as a
+    crossover.
+    """
+    by_size = {}
+    for row in rows:
+        by_size.setdefault(row['n'], {})[row['variant']] = row['median_ms']
+
+    leaders = []
+    for n in sorted(by_size):
+        times = by_size[n]
+        best = min(times.values())
+        leaders.append((n, next(v for v, t in times.items() if t <= best * (1 + TIE_MARGIN))))
+    return leaders
+
+
+def describe_crossover(rows):
+    """One sentence naming the fastest variant (up to TIE_MARGIN) per size range"""
+    ranges = []
+    for n, variant in fastest_by_size(rows):
+        if ranges and ranges[-1][0] == variant:
+            ranges[-1][2] = n
+        else:
+            ranges.append([variant, n, n])
+    margin = f"{TIE_MARGIN:.0%}"
+    if len(ranges) == 1:
+        return f"`{ranges[0][0]}` is fastest, or within {margin} of the fastest, at every measured size."
+    parts = [f"`{variant}` for n = {low:,}..{high:,}" for variant, low, high in ranges]
+    return f"Fastest (variants within {margin} count as tied; the earlier-listed one is named): " + ", ".join(parts) + "."
+
+
+def render_summary(folder, rows, options=()):
+    """Markdown block (between markers) for the problem README; options are the non-default CLI flags"""
+    variants = list(dict.fromkeys(row['variant'] for row in rows))
+    by_key = {(row['n'], row['variant']): row for row in rows}
+    sizes = sorted({row['n'] for row in rows})
+    problem_id = int(folder.split('-')[0])
+
+    lines = [
+        README_START,
+        '### Measured comparison',
+        '',
+        '| n | ' + ' | '.join(f"`{v}`" for v in variants) + ' |',
+        '|---:|' + '---:|' * len(variants),
+    ]
+    for n in sizes:
+        cells = [f"{by_key[n, v]['median_ms']:.3f} ms / {by_key[n, v]['peak_kib']:.1f} KiB" for v in variants]
+        lines.append(f"| {n:,} | " + ' | '.join(cells) + ' |')
+    lines += [
+        '',
+        f"Median time / peak memory per call. {describe_crossover(rows)}",
+        f"_Generated by `python scripts/compare-solutions.py {' '.join([str(problem_id), *options])}` "
+        f"({platform.python_implementation()} {platform.python_version()})._",
+        README_END,
+    ]
+    return '\n'.join(lines)
+
+
+def update_readme(readme_path, summary):
+    """Replace the marked block, or insert it at the end of the complexity section; return True if changed"""
+    with open(readme_path, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    if README_START in content and README_END in content:
+        pattern = re.escape(README_START) + r'.*?' + re.escape(README_END)
+        updated = re.sub(pattern, lambda _: summary, content, count=1, flags=re.DOTALL)
+    else:
+        heading = next((h for h in COMPLEXITY_HEADINGS if h in content), None)
+        if heading is None:
+            updated = content.rstrip('\n') + f"\n\n## Complexity Analysis\n\n{summary}\n"
+        else:
+            start = content.index(heading) + len(heading)
+            next_section = content.find('\n## ', start)
+            end = len(content) if next_section == -1 else next_section
+            section = content[:end].rstrip('\n')
+            updated = f"{section}\n\n{summary}\n" + (content[end:] if next_section != -1 else '')
+
+    if updated == content:
+        return False
+    with open(readme_path, 'w', encoding='utf-8') as f:
+        f.write(updated)
+    return True
+
+
+def print_table(folder, rows, buffer=None):
+    """Terminal table: one line per size, time / memory per variant"""
+    variants = list(dict.fromkeys(row['variant'] for row in rows))
+    by_key = {(row['n'], row['variant']): row for row in rows}
+    print(f"\n⚖️  {folder}{f' ({buffer} inputs)' if buffer else ''}")
+    print(f"   {'n':>8}  " + '  '.join(f"{v:>28}" for v in variants))
+    for n in sorted({row['n'] for row in rows}):
+        cells = [f"{by_key[n, v]['median_ms']:9.3f} ms {by_key[n, v]['peak_kib']:10.1f} KiB" for v in variants]
+        print(f"   {n:>8}  " + '  '.join(f"{c:>28}" for c in cells))
+    if len(variants) > 1:
+        print(f"   {describe_crossover(rows).replace('`', '')}")
+
+
+def main():
+    """Main function"""
+    args = sys.argv[1:]
+    min_power = option_value(args, '--min-power', int, 10)
+    max_power = option_value(args, '--max-power', int, 16)
+    repeats = option_value(args, '--repeats', int, DEFAULT_REPEATS)
+    buffer = buffer_option(args)
+    write_readme = '--no-readme' not in args and buffer is None
+    options = [f"{name} {value}" for name, value, default in (
+        ('--min-power', min_power, 10), ('--max-power', max_power, 16), ('--repeats', repeats, DEFAULT_REPEATS),
+    ) if value != default]
+    filters = [arg for arg in args if not arg.startswith('-')]
+
+    files = discover_solution_files(filters=filters)
+    if not files:
+        print("❌ No solution files found")
+        sys.exit(1)
+
+    groups = {}
+    for path in files:
+        groups.setdefault(os.path.dirname(path), []).append(path)
+
+    failures = []
+    for problem_dir, paths in groups.items():
+        folder = os.path.basename(problem_dir)
+        if get_input_generator(paths[0]) is None:
+            print(f"\n⏭️  {folder}: no generate_input(n, rng), skipped")
+            continue
+        try:
+            rows = compare_problem(paths, min_power, max_power, repeats, buffer=buffer)
+        except OutputMismatch as e:
+            print(f"\n❌ {folder}: {e}")
+            failures.append(folder)
+            continue
+
+        print_table(folder, rows, buffer)
+        csv_path = write_csv(folder, rows, buffer)
+        print(f"   📄 {os.path.relpath(csv_path, PROJECT_ROOT)}")
+
+        # A README summary only makes sense when there is something to compare against
+        if write_readme and len(paths) > 1:
+            readme_path = os.path.join(problem_dir, 'README.md')
+            if os.path.exists(readme_path) and update_readme(readme_path, render_summary(folder, rows, options)):
+                print(f"   📝 Updated {os.path.relpath(readme_path, PROJECT_ROOT)}")
+
+    if failures:
+        print(f"\n❌ Variants disagree: {', '.join(failures)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
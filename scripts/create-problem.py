@@ -7,7 +7,6 @@ Based on new project structure: problem-centric organization
 import os
 import sys
 import re
-import yaml
 from datetime import datetime
 
 
@@ -22,7 +21,7 @@ def kebab_case(text):
 
 
 def create_problem_structure(problem_id, title, difficulty, languages=['python'], topics=None):
-    """Create complete structure for new problem"""
+    """Create complete structure for new problem, return the problem folder (None if it already exists)"""
     
     # Format problem ID (5 digits)
     problem_id_str = f"{int(problem_id):05d}"
@@ -37,7 +36,7 @@ def create_problem_structure(problem_id, title, difficulty, languages=['python']
     
     if os.path.exists(problem_dir):
         print(f"❌ Error: Problem folder already exists: {problem_dir}")
-        return
+        return None
     
     os.makedirs(problem_dir)
     print(f"✅ Created problem folder: {problem_dir}")
@@ -116,6 +115,7 @@ Add solution notes and insights here
     
     print(f"\n🎉 Problem {problem_id}. {title} created successfully!")
     print(f"📁 Folder: {problem_dir}")
+    return problem_dir
 
 
 def create_python_solution(problem_dir, problem_id, title, url_slug, topics=None):
@@ -155,9 +155,16 @@ class Solution:
         pass
 
 
+# Optional: random input of size n for measure-complexity / bench / compare-solutions / stress
+# (problems without it are skipped); return the tuple of arguments for solve(), e.g.
+#
+# def generate_input(n, rng):
+#     return (rng.choices(range(-100, 101), k=n),)
+
+
 import sys as _sys, pathlib as _pl
 _sys.path.insert(0, str(_pl.Path(__file__).parents[2]))
-from lc_utils import analyze_complexity as _analyze_complexity
+from lc_utils import record_complexity as _record_complexity
 
 
 def test_solution():
@@ -190,17 +197,9 @@ def test_solution():
         print(f"Test {{i+1}}: input={{input_data}} -> {{result}} (Expected: {{expected}})")
         assert result == expected, f"Test {{i+1}} failed"
 
-    # Auto-analyze and update complexity in file header
-    import re as _re, pathlib as _pl
-    tc, sc = _analyze_complexity(Solution.solve)
-    _path = _pl.Path(__file__)
-    _text = _path.read_text(encoding='utf-8')
-    _text = _re.sub(r'^( {{4}}time_complexity = ")[^"]*"', r'\g<1>' + tc + '"', _text, flags=_re.MULTILINE)
-    _text = _re.sub(r'^( {{4}}space_complexity = ")[^"]*"', r'\g<1>' + sc + '"', _text, flags=_re.MULTILINE)
-    _text = _re.sub(r'Time Complexity: O\([^)]*\)', 'Time Complexity: ' + tc, _text)
-    _text = _re.sub(r'Space Complexity: O\([^)]*\)', 'Space Complexity: ' + sc, _text)
-    _path.write_text(_text, encoding='utf-8')
-    print('✅ Complexity updated → Time: %s, Space: %s' % (tc, sc))
+    # Record analyzed complexity in complexity.json (the source file is never rewritten)
+    tc, sc = _record_complexity(__file__, Solution.solve)
+    print('✅ Complexity → Time: %s, Space: %s' % (tc, sc))
 
     print("All tests passed!")
 
@@ -358,7 +357,8 @@ def main():
         print(f"Supported languages: {', '.join(supported_languages)}")
         sys.exit(1)
     
-    create_problem_structure(problem_id, title, difficulty, languages, topics)
+    if create_problem_structure(problem_id, title, difficulty, languages, topics) is None:
+        sys.exit(1)
 
 
 if __name__ == "__main__":
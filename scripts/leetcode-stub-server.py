@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Local LeetCode stub server
+Replays recorded GraphQL questionData responses so create.py can run offline
+
+Usage: python scripts/leetcode-stub-server.py <recordings_dir> [--port 8765] [--latency 0.2] [--fail-rate 0.1]
+       (--latency and --fail-rate apply to GraphQL requests only)
+Then:  LEETCODE_URL=http://127.0.0.1:8765 python create.py 1 20 26
+
+Committed recordings (Two Sum, Search Insert Position, Plus One and the bulk list):
+       python scripts/leetcode-stub-server.py tests/fixtures/leetcode
+       LEETCODE_URL=http://127.0.0.1:8765 python create.py 35 66
+
+Recordings directory layout:
+    <titleSlug>.json   raw GraphQL response body ({"data": {"question": {...}}})
+    catalog.json       optional /api/problems/all/ body (built from the recordings if missing)
+"""
+
+import os
+import sys
+import json
+import time
+import random
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+def load_recordings(recordings_dir):
+    """Load recorded question responses keyed by titleSlug"""
+    recordings = {}
+    for name in sorted(os.listdir(recordings_dir)):
+        if not name.endswith('.json') or name == 'catalog.json':
+            continue
+        with open(os.path.join(recordings_dir, name), 'r', encoding='utf-8') as f:
+            recordings[name[:-len('.json')]] = json.load(f)
+    return recordings
+
+
+def build_catalog(recordings_dir, recordings):
+    """Return the recorded catalog, or synthesize one from the question recordings"""
+    catalog_file = os.path.join(recordings_dir, 'catalog.json')
+    if os.path.exists(catalog_file):
+        with open(catalog_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    pairs = []
+    for slug, body in recordings.items():
+        question = (body.get('data') or {}).get('question') or {}
+        pairs.append({'stat': {
+            'question_id': int(question.get('questionId') or 0),
+            'frontend_question_id': int(question.get('questionFrontendId') or 0),
+            'question__title_slug': slug,
+        }})
+    return {'stat_status_pairs': pairs}
+
+
+def make_handler(recordings, catalog, latency, fail_rate):
+    """Create a request handler bound to the loaded recordings"""
+
+    class StubHandler(BaseHTTPRequestHandler):
+        def _send_json(self, status, body):
+            data = json.dumps(body).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def _simulate_network(self):
+            """Apply artificial latency and transient failures; return True if the request should fail"""
+            if latency:
+                time.sleep(latency)
+            return fail_rate and random.random() < fail_rate
+
+        def do_GET(self):
+            if self.path.rstrip('/') == '/api/problems/all':
+                self._send_json(200, catalog)
+            else:
+                self._send_json(404, {'error': f'unknown path {self.path}'})
+
+        def do_POST(self):
+            length = int(self.headers.get('Content-Length') or 0)
+            try:
+                payload = json.loads(self.rfile.read(length) or b'{}')
+            except ValueError:
+                self._send_json(400, {'error': 'invalid JSON body'})
+                return
+
+            if self._simulate_network():
+                self._send_json(503, {'error': 'simulated failure'})
+            elif self.path.rstrip('/') != '/graphql':
+                self._send_json(404, {'error': f'unknown path {self.path}'})
+            else:
+                slug = (payload.get('variables') or {}).get('titleSlug')
+                self._send_json(200, recordings.get(slug, {'data': {'question': None}}))
+
+        def log_message(self, format, *args):
+            sys.stderr.write("[stub] %s\n" % (format % args))
+
+    return StubHandler
+
+
+def main():
+    """Main function"""
+    if len(sys.argv) < 2:
+        print("Usage: python leetcode-stub-server.py <recordings_dir> [--port 8765] [--latency 0.2] [--fail-rate 0.1]")
+        sys.exit(1)
+
+    recordings_dir = sys.argv[1]
+    port, latency, fail_rate = 8765, 0.0, 0.0
+
+    i = 2
+    while i < len(sys.argv):
+        if sys.argv[i] == '--port' and i + 1 < len(sys.argv):
+            port = int(sys.argv[i + 1])
+        elif sys.argv[i] == '--latency' and i + 1 < len(sys.argv):
+            latency = float(sys.argv[i + 1])
+        elif sys.argv[i] == '--fail-rate' and i + 1 < len(sys.argv):
+            fail_rate = float(sys.argv[i + 1])
+        else:
+            print(f"❌ Unknown argument: {sys.argv[i]}")
+            sys.exit(1)
+        i += 2
+
+    recordings = load_recordings(recordings_dir)
+    catalog = build_catalog(recordings_dir, recordings)
+    server = ThreadingHTTPServer(('127.0.0.1', port), make_handler(recordings, catalog, latency, fail_rate))
+
+    print(f"✅ Serving {len(recordings)} recorded problems on http://127.0.0.1:{port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
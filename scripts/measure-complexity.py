@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Empirical complexity measurement for solutions
+Times each solution on generated inputs of size 2^10 .. 2^20 and fits the growth curve
+against O(1) / O(log n) / O(n) / O(n log n) / O(n^2); --memory records tracemalloc peaks instead
+
+Usage: python scripts/measure-complexity.py [problem ...] [--memory] [--max-power N] [--repeats 3] [--check]
+                                            [--buffer array|memoryview]
+Example: python scripts/measure-complexity.py 20 283
+Example: python scripts/measure-complexity.py --check    # exit 1 if a solution grows faster than declared
+                                                         # (timing fit or static analysis)
+Example: python scripts/measure-complexity.py --memory   # flag "in-place" solutions whose peak memory grows
+Example: python scripts/measure-complexity.py 283 --buffer array   # list[int] inputs as array.array('q')
+
+Solutions opt in by defining a module-level generate_input(n, rng) that returns the argument
+tuple for one call; alternative solutions reuse their problem's solution-python.py generator.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from lc_utils import (
+    PROJECT_ROOT, COMPLEXITY_MODELS, discover_solution_files, load_solution, option_value, buffer_option,
+    get_entry_point, get_input_generator, buffer_input_generator, declared_complexity,
+    measure_time_complexity, measure_space_complexity, analyze_complexity,
+)
+
+
+# --check fails only when the fit is this confident AND the log-log slope exceeds the declared
+# polynomial degree by SLOPE_MARGIN; a lone log factor (O(n) vs O(n log n)) is within timing
+# noise (allocator and cache effects) over 2^10..2^20, so it is reported as a warning only
+CHECK_CONFIDENCE = 0.5
+SLOPE_MARGIN = 0.5
+
+_MODEL_RANK = {label: rank for rank, (label, _) in enumerate(COMPLEXITY_MODELS)}
+_MODEL_DEGREE = {'O(1)': 0, 'O(log n)': 0, 'O(n)': 1, 'O(n log n)': 1, 'O(n^2)': 2}
+
+
+def is_slower_than(measured, declared):
+    """True when the measured class grows strictly faster than the declared one"""
+    if measured not in _MODEL_RANK or declared not in _MODEL_RANK:
+        return False
+    return _MODEL_RANK[measured] > _MODEL_RANK[declared]
+
+
+def is_regression(result, declared):
+    """A confident fit whose growth exponent clearly exceeds the declared degree"""
+    return (
+        is_slower_than(result['complexity'], declared)
+        and result['confidence'] >= CHECK_CONFIDENCE
+        and result['slope'] - _MODEL_DEGREE[declared] >= SLOPE_MARGIN
+    )
+
+
+def static_exceeds(static, declared):
+    """True when the static analyzer's time bound is worse than the declared one
+
+    Labels outside the fitted models (O(n^3), O(2^n)) grow faster than all of them.
+    """
+    if declared not in _MODEL_RANK or static == 'O(?)':
+        return False
+    if static in _MODEL_RANK:
+        return _MODEL_RANK[static] > _MODEL_RANK[declared]
+    return True
+
+
+def main():
+    """Main function"""
+    args = sys.argv[1:]
+    memory = '--memory' in args
+    # tracemalloc slows execution several times over, so memory runs stop at smaller sizes
+    max_power = option_value(args, '--max-power', int, 16 if memory else 20)
+    repeats = option_value(args, '--repeats', int, 3)
+    buffer = buffer_option(args)
+    check = '--check' in args
+    kind = 'space' if memory else 'time'
+    filters = [arg for arg in args if not arg.startswith('-')]
+
+    files = discover_solution_files(filters=filters)
+    if not files:
+        print("❌ No solution files found")
+        sys.exit(1)
+
+    regressions = []
+    for path in files:
+        relative_path = os.path.relpath(path, os.path.join(PROJECT_ROOT, 'problems'))
+        generator = buffer_input_generator(get_input_generator(path), buffer)
+        if generator is None:
+            print(f"⏭️  {relative_path}: no generate_input(n, rng), skipped")
+            continue
+
+        func = get_entry_point(load_solution(path).Solution())
+        static_time, static_space = analyze_complexity(func)
+        if memory:
+            result = measure_space_complexity(func, generator, max_power=max_power)
+        else:
+            result = measure_time_complexity(func, generator, max_power=max_power, repeats=repeats)
+
+        declared = declared_complexity(path, kind)
+        print(f"\n{'🧠' if memory else '📈'} {relative_path}")
+        for n, cost in result['samples']:
+            if memory:
+                print(f"   n = {n:>8}: {cost / 1024:10.1f} KiB peak")
+            else:
+                print(f"   n = {n:>8}: {cost / 1e6:10.3f} ms")
+        print(f"   Best fit: {result['complexity']} (confidence {result['confidence']:.2f}, "
+              f"log-log slope {result['slope']:.2f}), declared: {declared or 'unknown'}")
+        print(f"   Static analysis: {static_space if memory else static_time}")
+
+        # The static bound is deterministic, so a time bound worse than declared always fails
+        if not memory and declared and static_exceeds(static_time, declared):
+            print(f"   ❌ Static analysis gives {static_time}, worse than declared {declared}")
+            regressions.append(relative_path)
+            continue
+
+        if declared and is_slower_than(result['complexity'], declared):
+            regression = is_regression(result, declared)
+            marker = "❌" if regression else "⚠️ "
+            if memory and _MODEL_DEGREE.get(declared) == 0:
+                print(f"   {marker} Declared in-place ({declared} space) but peak memory grows as {result['complexity']}")
+            else:
+                print(f"   {marker} Measured {result['complexity']} grows faster than declared {declared}")
+            if regression:
+                regressions.append(relative_path)
+
+    if regressions:
+        print(f"\n❌ Complexity regressions: {', '.join(regressions)}")
+        if check:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+Run every problem's Python tests in a single interpreter (or across a process pool)
+Discovers solution-python.py and alt*-python.py files, imports each one and calls its test_solution()
+
+Usage: python scripts/run-tests.py [problem ...] [-v] [--jobs N] [--timeout SEC] [--json PATH] [--junit PATH]
+Example: python scripts/run-tests.py
+Example: python scripts/run-tests.py 20 283 -v
+Example: python scripts/run-tests.py --jobs 0 --timeout 10 --junit test-results.xml
+"""
+
+import io
+import os
+import sys
+import json
+import time
+import signal
+import traceback
+import xml.etree.ElementTree as ET
+from contextlib import redirect_stdout
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from concurrent.futures import TimeoutError as FuturesTimeout
+from concurrent.futures.process import BrokenProcessPool
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from lc_utils import PROJECT_ROOT, discover_solution_files, load_solution, option_value
+
+
+DEFAULT_TIMEOUT = 30  # seconds per test file
+PARENT_GRACE = 5  # extra seconds the parent waits on a pool worker before killing it
+
+
+class TestTimeout(Exception):
+    """Raised inside a test file that exceeded its time budget"""
+
+
+def _raise_timeout(signum, frame):
+    raise TestTimeout()
+
+
+def run_solution_tests(path, timeout=None):
+    """Import one solution file and run its test_solution(), return a result dict
+
+    With a timeout (POSIX only), an interval timer interrupts runaway tests such as infinite loops.
+    """
+    relative_path = os.path.relpath(path, os.path.join(PROJECT_ROOT, 'problems'))
+    result = {'file': relative_path, 'status': 'passed', 'duration': 0.0, 'output': '', 'error': ''}
+    output = io.StringIO()
+    use_alarm = bool(timeout) and hasattr(signal, 'setitimer')
+
+    start = time.perf_counter()
+    try:
+        if use_alarm:
+            signal.signal(signal.SIGALRM, _raise_timeout)
+            signal.setitimer(signal.ITIMER_REAL, timeout)
+        with redirect_stdout(output):
+            module = load_solution(path)
+            test_solution = getattr(module, 'test_solution', None)
+            if test_solution is None:
+                result['status'] = 'skipped'
+                result['error'] = 'no test_solution() defined'
+            else:
+                test_solution()
+    except TestTimeout:
+        result['status'] = 'failed'
+        result['error'] = f"TestTimeout: exceeded {timeout}s"
+    except KeyboardInterrupt:
+        raise
+    except BaseException:
+        # SystemExit and friends from a solution must not take the runner down
+        result['status'] = 'failed'
+        result['error'] = traceback.format_exc()
+    finally:
+        if use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+    result['duration'] = time.perf_counter() - start
+    result['output'] = output.getvalue()
+    return result
+
+
+def run_all(files, jobs=1, timeout=None, verbose=False):
+    """Run every file serially or across a process pool, printing results as they finish"""
+    if jobs <= 1:
+        results = []
+        for path in files:
+            result = run_solution_tests(path, timeout)
+            print_result(result, verbose)
+            results.append(result)
+        return results
+
+    results = {}
+    broken = []
+    remaining = list(files)
+    # A crashing worker or a hang the worker's timer cannot interrupt ends the pool; the files it
+    # had not started go to a fresh pool, and files caught in a crash are re-run alone below
+    while remaining:
+        remaining, crashed = _run_pool(remaining, jobs, timeout, verbose, results)
+        broken += crashed
+
+    for path in sorted(broken, key=files.index):
+        result = _run_isolated(path, timeout)
+        print_result(result, verbose)
+        results[path] = result
+    return [results[path] for path in files]
+
+
+def _run_pool(files, jobs, timeout, verbose, results):
+    """Run files with at most `jobs` in flight until done or the pool has to go
+
+    The parent enforces the timeout too (plus PARENT_GRACE): a test stuck in C code never sees the
+    worker's SIGALRM, so on expiry it is reported as timed out and the pool's workers are killed.
+    Returns (files not finished, to run again; files in flight when a worker crashed).
+    """
+    queue = list(files)
+    running = {}  # future -> (path, parent-side deadline or None)
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        def submit():
+            path = queue.pop(0)
+            deadline = time.monotonic() + timeout + PARENT_GRACE if timeout else None
+            running[executor.submit(run_solution_tests, path, timeout)] = (path, deadline)
+
+        while queue and len(running) < jobs:
+            submit()
+        while running:
+            deadlines = [deadline for _, deadline in running.values() if deadline is not None]
+            wait_for = max(0.0, min(deadlines) - time.monotonic()) if deadlines else None
+            done, _ = wait(running, timeout=wait_for, return_when=FIRST_COMPLETED)
+
+            if not done:
+                expired = [future for future, (_, deadline) in running.items()
+                           if deadline is not None and deadline <= time.monotonic()]
+                if not expired:
+                    continue
+                for future in expired:
+                    path, _ = running.pop(future)
+                    result = _timeout_result(path, timeout)
+                    print_result(result, verbose)
+                    results[path] = result
+                _kill_workers(executor)
+                return [path for path, _ in running.values()] + queue, []
+
+            crashed = []
+            for future in done:
+                path, _ = running.pop(future)
+                try:
+                    result = future.result()
+                except BrokenProcessPool:
+                    crashed.append(path)
+                    continue
+                print_result(result, verbose)
+                results[path] = result
+            if crashed:
+                return queue, crashed + [path for path, _ in running.values()]
+            while queue and len(running) < jobs:
+                submit()
+    return [], []
+
+
+def _run_isolated(path, timeout):
+    """Run one file in its own single-worker pool so a crash is attributed to it alone"""
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(run_solution_tests, path, timeout)
+        try:
+            return future.result(timeout=timeout + PARENT_GRACE if timeout else None)
+        except FuturesTimeout:
+            _kill_workers(executor)
+            return _timeout_result(path, timeout)
+        except BrokenProcessPool:
+            return {
+                'file': os.path.relpath(path, os.path.join(PROJECT_ROOT, 'problems')),
+                'status': 'failed', 'duration': 0.0, 'output': '',
+                'error': 'Worker process died while running this file',
+            }
+
+
+def _timeout_result(path, timeout):
+    """Result for a file whose worker the parent had to kill"""
+    return {
+        'file': os.path.relpath(path, os.path.join(PROJECT_ROOT, 'problems')),
+        'status': 'failed', 'duration': float(timeout), 'output': '',
+        'error': f"TestTimeout: exceeded {timeout}s (worker killed)",
+    }
+
+
+def _kill_workers(executor):
+    """Kill every worker process of a pool (ProcessPoolExecutor only has a public API for this from 3.14)"""
+    kill_workers = getattr(executor, 'kill_workers', None)
+    if kill_workers is not None:
+        kill_workers()
+        return
+    for process in list((executor._processes or {}).values()):
+        process.kill()
+
+
+def write_json_report(path, results, elapsed):
+    """Write results as JSON"""
+    report = {
+        'summary': summarize(results, elapsed),
+        'results': results,
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+
+
+def write_junit_report(path, results, elapsed):
+    """Write results as JUnit XML (one testcase per solution file)"""
+    summary = summarize(results, elapsed)
+    suite = ET.Element('testsuite', {
+        'name': 'leetcode',
+        'tests': str(summary['total']),
+        'failures': str(summary['failed']),
+        'skipped': str(summary['skipped']),
+        'time': f"{elapsed:.3f}",
+    })
+    for result in results:
+        folder, file_name = os.path.split(result['file'])
+        case = ET.SubElement(suite, 'testcase', {
+            'classname': folder,
+            'name': file_name,
+            'time': f"{result['duration']:.3f}",
+        })
+        if result['status'] == 'failed':
+            message = result['error'].strip().splitlines()[-1] if result['error'].strip() else 'failed'
+            ET.SubElement(case, 'failure', {'message': message}).text = result['error']
+        elif result['status'] == 'skipped':
+            ET.SubElement(case, 'skipped', {'message': result['error']})
+        if result['output']:
+            ET.SubElement(case, 'system-out').text = result['output']
+    ET.ElementTree(suite).write(path, encoding='utf-8', xml_declaration=True)
+
+
+def print_result(result, verbose=False):
+    """Print one result line (plus captured output / traceback when useful)"""
+    icon = {'passed': '✅', 'failed': '❌', 'skipped': '⏭️ '}[result['status']]
+    print(f"{icon} {result['file']:<60} {result['duration'] * 1000:8.1f} ms")
+
+    if verbose and result['output']:
+        print('    ' + result['output'].rstrip().replace('\n', '\n    '))
+    if result['status'] == 'failed':
+        print('    ' + result['error'].rstrip().replace('\n', '\n    '))
+    elif result['status'] == 'skipped':
+        print(f"    {result['error']}")
+
+
+def summarize(results, elapsed):
+    """Count results by status"""
+    summary = {status: sum(r['status'] == status for r in results) for status in ('passed', 'failed', 'skipped')}
+    summary['total'] = len(results)
+    summary['elapsed'] = round(elapsed, 3)
+    return summary
+
+
+def print_summary(results, elapsed):
+    """Print pass/fail totals"""
+    counts = summarize(results, elapsed)
+    print(f"\n=== {len(results)} files: {counts['passed']} passed, {counts['failed']} failed, "
+          f"{counts['skipped']} skipped in {elapsed:.2f}s ===")
+
+
+def main():
+    """Main function"""
+    args = sys.argv[1:]
+    jobs = option_value(args, '--jobs', int, 1)
+    timeout = option_value(args, '--timeout', float, DEFAULT_TIMEOUT)
+    json_path = option_value(args, '--json', str, None)
+    junit_path = option_value(args, '--junit', str, None)
+    verbose = '-v' in args
+    filters = [arg for arg in args if not arg.startswith('-')]
+
+    if jobs <= 0:
+        jobs = os.cpu_count() or 1
+
+    files = discover_solution_files(filters=filters)
+    if not files:
+        print("❌ No solution files found")
+        sys.exit(1)
+
+    start = time.perf_counter()
+    results = run_all(files, jobs, timeout, verbose)
+    elapsed = time.perf_counter() - start
+
+    print_summary(results, elapsed)
+    if json_path:
+        write_json_report(json_path, results, elapsed)
+        print(f"📄 JSON report: {json_path}")
+    if junit_path:
+        write_junit_report(junit_path, results, elapsed)
+        print(f"📄 JUnit report: {junit_path}")
+    if any(r['status'] == 'failed' for r in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
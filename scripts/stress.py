@@ -0,0 +1,408 @@
+#!/usr/bin/env python3
+"""
+Randomized stress and differential testing
+Runs every variant of a problem on many random small inputs against a brute-force oracle (or the
+primary solution), shrinks any failing input to a minimal counterexample, then times every variant
+at the size limit from the problem's Constraints block to expose performance cliffs
+
+Usage: python scripts/stress.py [problem ...] [--rounds N] [--small N] [--max-size N] [--seed N]
+                                [--time-limit SEC] [--buffer array|memoryview] [--fetch]
+Example: python scripts/stress.py 20
+Example: python scripts/stress.py 283 --rounds 2000 --max-size 100000
+Example: python scripts/stress.py 283 --buffer array --max-size 5000000   # int64 buffers, 8 bytes per element
+Example: python scripts/stress.py 283 --no-vectors                         # skip problems/*/vectors/*.vec
+
+Inputs come from the solution's generate_stress_input(n, rng) or generate_input(n, rng); without
+either, they are generated from the question's metaData and Constraints (cached by create.py,
+--fetch downloads missing questions). A module-level brute_force(*args) in solution-python.py is
+used as the oracle when defined. With --buffer, list[int] arguments are passed to every variant
+(and the oracle) as array.array('q') or memoryview; counterexamples are still printed as lists.
+Binary test vectors stored under the problem's vectors/ folder (scripts/vectors.py generate) run
+last: every variant gets its own copy-on-write mapping and must agree with the primary solution.
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import random
+import signal
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from lc_utils import (
+    PROJECT_ROOT, discover_solution_files, load_module, load_solution, get_entry_point, option_value,
+    get_input_generator, get_problem_hook, canonical_output, copy_args, to_buffer_args,
+    buffer_option, get_test_vectors, TestVector,
+)
+
+
+DEFAULT_MAX_SIZE = 10 ** 5   # LeetCode's usual array limit when no constraint is known
+DEFAULT_TIME_LIMIT = 1.0     # seconds per call at the size limit
+SHRINK_SEEDS = 20            # random inputs tried per size while shrinking
+
+
+class StressTimeout(Exception):
+    """A call exceeded its hard time cap"""
+
+
+def _raise_timeout(signum, frame):
+    raise StressTimeout()
+
+
+def run_outcome(path, func, args, timeout=None, copy=True, timings=None):
+    """Call func on a copy of args, return ('ok', canonical output) or ('error', exception name)
+
+    copy=False when args already belong to this call alone (e.g. a freshly mapped test vector).
+    With a timings list, the duration of the call alone (no copying or canonicalizing) is appended.
+    """
+    run_args = copy_args(args) if copy else args
+    use_alarm = bool(timeout) and hasattr(signal, 'setitimer')
+    start = time.perf_counter()
+    try:
+        if use_alarm:
+            signal.signal(signal.SIGALRM, _raise_timeout)
+            signal.setitimer(signal.ITIMER_REAL, timeout)
+        result = func(*run_args)
+    except StressTimeout:
+        return 'error', 'Timeout'
+    except RecursionError:
+        return 'error', 'RecursionError'
+    except Exception as e:
+        return 'error', type(e).__name__
+    finally:
+        if use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+        if timings is not None:
+            timings.append(time.perf_counter() - start)
+    return 'ok', canonical_output(path, run_args, result)
+
+
+# --- Constraints ---
+
+def load_question(problem_dir, fetch=False):
+    """Cached questionData info ({'content', 'metaData', ...}) for a problem folder, or None"""
+    import yaml
+
+    try:
+        create = load_module(os.path.join(PROJECT_ROOT, 'create.py'))
+    except ImportError:
+        # create.py needs requests; without it there is no question cache to read
+        return None
+
+    readme = os.path.join(problem_dir, 'README.md')
+    slug = None
+    try:
+        with open(readme, 'r', encoding='utf-8') as f:
+            m = re.match(r'^---\s*\n(.*?)\n---', f.read(), flags=re.DOTALL)
+        slug = (yaml.safe_load(m.group(1)) or {}).get('url_slug') if m else None
+    except (OSError, yaml.YAMLError):
+        pass
+    if not slug:
+        slug = os.path.basename(problem_dir).split('-', 1)[1]
+
+    detail_data = create.load_cached_question(slug)
+    if detail_data is not None:
+        return create._parse_question_data(detail_data)
+    if fetch:
+        return create.get_leetcode_problem_info(int(os.path.basename(problem_dir).split('-')[0]))
+    return None
+
+
+def parse_question_constraints(question):
+    """Constraints dict for a parsed question (empty without one)"""
+    if not question:
+        return {}
+    create = load_module(os.path.join(PROJECT_ROOT, 'create.py'))
+    return create.parse_constraints(question.get('content', ''))
+
+
+def size_limits(constraints, meta_data):
+    """(min, max) input size from the first sequence parameter's `.length` constraint"""
+    params = json.loads(meta_data or '{}').get('params') or []
+    for param in params:
+        bounds = constraints.get(f"{param.get('name')}.length")
+        if bounds:
+            return bounds
+    lengths = [bounds for name, bounds in constraints.items() if name.endswith('.length')]
+    return lengths[0] if lengths else None
+
+
+def constraint_input_generator(constraints, meta_data):
+    """Build a generate_input(n, rng) from metaData parameter types and Constraints bounds
+
+    Returns None when a parameter's type or bounds are unknown.
+    """
+    params = json.loads(meta_data or '{}').get('params') or []
+    if not params:
+        return None
+
+    def value_range(name):
+        return constraints.get(f"{name}[i]") or constraints.get(name) or (-10 ** 4, 10 ** 4)
+
+    makers = []
+    for param in params:
+        name, kind = param.get('name'), param.get('type')
+        if kind == 'integer[]':
+            low, high = value_range(name)
+            makers.append(lambda n, rng, low=low, high=high: [rng.randint(low, high) for _ in range(n)])
+        elif kind == 'string':
+            alphabet = constraints.get(f"{name}.alphabet", 'abcdefghijklmnopqrstuvwxyz')
+            makers.append(lambda n, rng, alphabet=alphabet: ''.join(rng.choice(alphabet) for _ in range(n)))
+        elif kind == 'integer' and name in constraints:
+            low, high = constraints[name]
+            makers.append(lambda n, rng, low=low, high=high: rng.randint(low, high))
+        else:
+            return None
+
+    def generate_input(n, rng):
+        return tuple(make(n, rng) for make in makers)
+    return generate_input
+
+
+# --- Differential testing ---
+
+class Differential:
+    """Outcomes of every variant (and the oracle) on one input, compared with the reference"""
+
+    def __init__(self, paths, oracle=None, buffer=None):
+        self.primary = paths[0]
+        self.variants = [(path, get_entry_point(load_solution(path).Solution())) for path in paths]
+        self.oracle = oracle
+        self.buffer = buffer
+
+    def run(self, path, func, args):
+        """run_outcome on the input as this run's variants see it (list or buffer-backed)"""
+        return run_outcome(path, func, to_buffer_args(args, self.buffer))
+
+    def reference(self, args):
+        if self.oracle is not None:
+            return self.run(self.primary, self.oracle, args)
+        return self.run(self.primary, self.variants[0][1], args)
+
+    def mismatches(self, args):
+        """[(variant file, outcome, expected outcome)] for variants that disagree with the reference"""
+        expected = self.reference(args)
+        candidates = self.variants if self.oracle is not None else self.variants[1:]
+        found = []
+        for path, func in candidates:
+            outcome = self.run(path, func, args)
+            if outcome != expected:
+                found.append((os.path.basename(path), outcome, expected))
+        return found
+
+    def signature(self, args):
+        """frozenset of (variant, 'ok' for a wrong answer or the exception name) for every mismatch
+
+        None when the reference itself rejects the input (not a valid counterexample).
+        """
+        if self.reference(args)[0] == 'error':
+            return None
+        return frozenset(
+            (variant, outcome[0] if outcome[0] == 'ok' else outcome[1])
+            for variant, outcome, _ in self.mismatches(args)
+        )
+
+    def fails(self, args, signature):
+        """Counterexample predicate used while shrinking: the same variants fail in the same way
+
+        A candidate that breaks an invariant tying arguments together (e.g. len(nums) == 2 * n) tends
+        to make correct variants raise as well, which changes the signature, so it is rejected.
+        """
+        return self.signature(args) == signature
+
+
+def shrink(args, differential, generator, n, min_size=0):
+    """Reduce a failing input: regenerate at smaller sizes, then delete sequence elements
+
+    Neither step goes below min_size (the Constraints lower bound), so the counterexample stays a
+    valid input, and every accepted candidate shows the original discrepancy: the same variants fail
+    in the same way and no variant that passed starts to raise.
+    """
+    signature = differential.signature(args)
+
+    # 1. Smallest generated size that still fails keeps generate_input's invariants intact
+    size = n
+    while size > min_size:
+        smaller = max(size // 2, min_size)
+        for seed in range(SHRINK_SEEDS):
+            candidate = generator(smaller, random.Random(seed))
+            if differential.fails(candidate, signature):
+                args, size = candidate, smaller
+                break
+        else:
+            break
+
+    # 2. Delete chunks of each list / string argument while the failure persists
+    args = list(args)
+    for index, value in enumerate(args):
+        if not isinstance(value, (list, str)):
+            continue
+        chunk = max(1, len(value) // 2)
+        while chunk >= 1:
+            start = 0
+            while start < len(args[index]):
+                current = args[index]
+                if len(current) - min(chunk, len(current) - start) < min_size:
+                    break
+                candidate = list(args)
+                candidate[index] = current[:start] + current[start + chunk:]
+                if differential.fails(tuple(candidate), signature):
+                    args = candidate
+                else:
+                    start += chunk
+            chunk //= 2
+    return tuple(args)
+
+
+def _short_repr(value, limit=200):
+    text = repr(value)
+    return text if len(text) <= limit else text[:limit] + f"... ({len(text)} chars)"
+
+
+def stress_problem(paths, rounds, small, max_size, seed, time_limit, fetch, buffer=None, vectors=True):
+    """Stress one problem, print findings and return True when everything agreed and fit the time limit"""
+    problem_dir = os.path.dirname(paths[0])
+    folder = os.path.basename(problem_dir)
+
+    question = load_question(problem_dir, fetch)
+    constraints = parse_question_constraints(question)
+    limits = size_limits(constraints, (question or {}).get('metaData'))
+    # Stress inputs should include invalid / adversarial cases, not just the worst-case timing input
+    generator = get_problem_hook(paths[0], 'generate_stress_input')
+    source = 'generate_stress_input'
+    if generator is None:
+        generator = get_input_generator(paths[0])
+        source = 'generate_input'
+    if generator is None and question:
+        generator = constraint_input_generator(constraints, question.get('metaData'))
+        source = 'constraints'
+    if generator is None:
+        print(f"\n⏭️  {folder}: no generate_input(n, rng) and no cached constraints, skipped")
+        return True
+
+    # LeetCode inputs are non-empty unless the Constraints say otherwise
+    min_size, limit = limits if limits else (1, DEFAULT_MAX_SIZE)
+    if max_size:
+        limit = max_size
+    oracle = get_problem_hook(paths[0], 'brute_force')
+    differential = Differential(paths, oracle, buffer)
+
+    print(f"\n🔥 {folder}: {len(paths)} variant(s), oracle: {'brute_force' if oracle else 'primary solution'}, "
+          f"inputs: {source}{f' as {buffer}' if buffer else ''}, "
+          f"size limit: {limit:,}{' (from Constraints)' if limits and not max_size else ''}")
+
+    # Correctness: many small random inputs
+    rng = random.Random(seed)
+    for round_index in range(rounds):
+        n = rng.randint(min(min_size, small), small)
+        args = generator(n, random.Random(seed * 1_000_003 + round_index))
+        if differential.reference(args)[0] == 'error' or not differential.mismatches(args):
+            continue
+
+        minimal = shrink(args, differential, generator, n, min_size)
+        print(f"   ❌ Mismatch in round {round_index} (n = {n}), shrunk to: {_short_repr(minimal)}")
+        for variant, outcome, expected in differential.mismatches(minimal):
+            print(f"      {variant}: {_short_repr(outcome[1])} ({outcome[0]}), "
+                  f"expected {_short_repr(expected[1])} ({expected[0]})")
+        return False
+    print(f"   ✅ {rounds} random inputs (n ≤ {small}) agree")
+
+    # Scale: every variant at the size limit; variants must still agree, the oracle is skipped.
+    # The generated lists are dropped once packed, so only the buffers stay alive
+    args = to_buffer_args(generator(limit, random.Random(seed)), buffer)
+    ok = True
+    expected = None
+    for index, (path, func) in enumerate(differential.variants):
+        timings = []
+        outcome = run_outcome(path, func, args, timeout=time_limit * 10, timings=timings)
+        elapsed = timings[0]
+        name = os.path.basename(path)
+
+        if outcome[0] == 'error':
+            print(f"   ❌ {name}: {outcome[1]} at n = {limit:,}")
+            ok = False
+            continue
+        if index == 0:
+            expected = outcome
+        elif expected is not None and outcome != expected:
+            print(f"   ❌ {name}: output differs from {os.path.basename(paths[0])} at n = {limit:,}")
+            ok = False
+        marker = "✅" if elapsed <= time_limit else "🐢"
+        print(f"   {marker} {name}: {elapsed * 1000:.1f} ms at n = {limit:,}")
+        if elapsed > time_limit:
+            ok = False
+
+    # Stored vectors are usually far beyond the size limit, so they are checked for agreement only
+    if vectors and not run_vectors(paths):
+        ok = False
+    return ok
+
+
+def run_vectors(paths):
+    """Run every variant on each stored test vector; return True when all agree without errors"""
+    ok = True
+    variants = [(path, get_entry_point(load_solution(path).Solution())) for path in paths]
+    for vector_path in get_test_vectors(paths[0]):
+        name = os.path.basename(vector_path)
+        expected = None
+        for index, (path, func) in enumerate(variants):
+            variant = os.path.basename(path)
+            timings = []
+            # A fresh ACCESS_COPY mapping per variant: in-place writes never reach the file or the next run
+            try:
+                with TestVector(vector_path) as vector:
+                    outcome = run_outcome(path, func, vector.args, copy=False, timings=timings)
+                    size = vector.size
+            except (OSError, ValueError) as e:
+                print(f"   ❌ {name}: unreadable test vector ({e})")
+                ok = False
+                break
+
+            if outcome[0] == 'error':
+                print(f"   ❌ {variant}: {outcome[1]} on {name}")
+                ok = False
+                continue
+            if index == 0:
+                expected = outcome
+            elif expected is not None and outcome != expected:
+                print(f"   ❌ {variant}: output differs from {os.path.basename(paths[0])} on {name}")
+                ok = False
+            # Without a primary result there is nothing to compare against; errors are still reported
+            print(f"   💾 {variant}: {timings[0] * 1000:.1f} ms on {name} (n = {size:,})")
+    return ok
+
+
+def main():
+    """Main function"""
+    args = sys.argv[1:]
+    rounds = option_value(args, '--rounds', int, 500)
+    small = option_value(args, '--small', int, 12)
+    max_size = option_value(args, '--max-size', int, None)
+    seed = option_value(args, '--seed', int, 0)
+    time_limit = option_value(args, '--time-limit', float, DEFAULT_TIME_LIMIT)
+    buffer = buffer_option(args)
+    fetch = '--fetch' in args
+    vectors = '--no-vectors' not in args
+    filters = [arg for arg in args if not arg.startswith('-')]
+
+    files = discover_solution_files(filters=filters)
+    if not files:
+        print("❌ No solution files found")
+        sys.exit(1)
+
+    groups = {}
+    for path in files:
+        groups.setdefault(os.path.dirname(path), []).append(path)
+
+    failed = [
+        os.path.basename(problem_dir) for problem_dir, paths in groups.items()
+        if not stress_problem(paths, rounds, small, max_size, seed, time_limit, fetch, buffer, vectors)
+    ]
+    if failed:
+        print(f"\n❌ Stress failures: {', '.join(failed)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
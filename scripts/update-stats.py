@@ -5,29 +5,48 @@ Based on new project structure: problem-centric organization
 Automatically count completed problems and progress
 """
 
+import io
 import os
+import sys
+import json
 import yaml
 import re
+import hashlib
 import subprocess
 from collections import defaultdict, Counter
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 
 
-def get_git_commit_date(folder_path):
-    """Get the last commit date for a folder using git"""
+def get_git_commit_dates(problems_dir):
+    """Map every problem folder to its last commit date with a single git log pass"""
     try:
         result = subprocess.run(
-            ['git', 'log', '-1', '--format=%cd', '--date=short', '--', folder_path],
-            cwd=os.path.dirname(folder_path),
+            ['git', '-c', 'core.quotePath=false', 'log', '--format=%x00%cd', '--date=short',
+             '--name-only', '--relative', '--', '.'],
+            cwd=problems_dir,
             capture_output=True,
             text=True,
-            timeout=5
+            timeout=60
         )
-        if result.returncode == 0 and result.stdout.strip():
-            return result.stdout.strip()
     except Exception:
-        pass
-    return None
+        return {}
+    if result.returncode != 0:
+        return {}
+
+    # Output is newest first: "\0<date>" header lines, each followed by the files that commit touched
+    commit_dates = {}
+    current_date = None
+    for line in result.stdout.splitlines():
+        if line.startswith('\0'):
+            current_date = line[1:]
+        elif line and current_date:
+            commit_dates.setdefault(line.split('/', 1)[0], current_date)
+    return commit_dates
+
+
+# libyaml's C loader is several times faster than the pure-Python one when available
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
 
 
 def parse_frontmatter(readme_content):
@@ -42,13 +61,109 @@ def parse_frontmatter(readme_content):
     
     frontmatter_text = readme_content[3:end_marker].strip()
     try:
-        return yaml.safe_load(frontmatter_text)
+        return yaml.load(frontmatter_text, Loader=YAML_LOADER)
     except yaml.YAMLError:
         return None
 
 
-def scan_problems(problems_dir):
-    """Scan problems directory, count completed problems from README frontmatter"""
+# Bump when the cached per-README data changes shape
+MANIFEST_VERSION = 1
+
+
+def load_manifest(manifest_path):
+    """Load the README manifest cache ({folder: {mtime_ns, size, sha256, meta}})"""
+    if not manifest_path or not os.path.exists(manifest_path):
+        return {}
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if manifest.get('version') != MANIFEST_VERSION:
+        return {}
+    return manifest.get('entries', {})
+
+
+def save_manifest(manifest_path, entries):
+    """Atomically write the README manifest cache"""
+    os.makedirs(os.path.dirname(manifest_path), exist_ok=True)
+    tmp_path = manifest_path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        # default=str keeps unquoted YAML dates serializable
+        json.dump({'version': MANIFEST_VERSION, 'entries': entries}, f, default=str, separators=(',', ':'))
+    os.replace(tmp_path, manifest_path)
+
+
+def read_frontmatter_cached(readme_file, cached):
+    """Return (meta_data, manifest_entry) for a README, re-parsing only when its content changed"""
+    st = os.stat(readme_file)
+    if cached and cached.get('mtime_ns') == st.st_mtime_ns and cached.get('size') == st.st_size:
+        return cached.get('meta'), cached
+
+    with open(readme_file, 'rb') as f:
+        raw = f.read()
+    digest = hashlib.sha256(raw).hexdigest()
+
+    # mtime moved but content is identical (fresh checkout, touch): keep the parsed result
+    if cached and cached.get('sha256') == digest:
+        meta_data = cached.get('meta')
+    else:
+        meta_data = parse_frontmatter(raw.decode('utf-8'))
+
+    return meta_data, {'mtime_ns': st.st_mtime_ns, 'size': st.st_size, 'sha256': digest, 'meta': meta_data}
+
+
+def scan_chunk(problems_dir, folders, cached_entries):
+    """Read and parse the READMEs of a batch of folders (runs in a worker process with --jobs)
+
+    Returns the per-folder results plus this batch's partial language/tag counters.
+    """
+    results = []
+    errors = []
+    languages = Counter()
+    tags = Counter()
+    
+    for problem_dir in folders:
+        readme_file = os.path.join(problems_dir, problem_dir, 'README.md')
+        if not os.path.exists(readme_file):
+            continue
+        
+        try:
+            # Parse frontmatter (cached by README mtime/size/hash)
+            cached = cached_entries.get(problem_dir)
+            meta_data, entry = read_frontmatter_cached(readme_file, cached)
+            if meta_data and not isinstance(meta_data, dict):
+                raise ValueError("frontmatter is not a mapping")
+            
+            # Count into per-folder counters first, so a bad README adds nothing
+            folder_languages = Counter(meta_data.get('languages') or []) if meta_data else Counter()
+            folder_tags = Counter(
+                tag for tag in (meta_data.get('tags') or [])
+                if tag not in ['tag1', 'tag2', 'tag3']  # Filter template tags
+            ) if meta_data else Counter()
+        except Exception as e:
+            errors.append(f"Error reading {readme_file}: {e}")
+            continue
+        
+        results.append((problem_dir, meta_data, entry, entry is not cached))
+        languages += folder_languages
+        tags += folder_tags
+    
+    return results, languages, tags, errors
+
+
+def _scan_chunk_job(args):
+    """Unpack arguments for ProcessPoolExecutor.map"""
+    return scan_chunk(*args)
+
+
+def scan_problems(problems_dir, manifest_path=None, jobs=1):
+    """Scan problems directory, count completed problems from README frontmatter
+
+    With manifest_path, unchanged READMEs are served from the manifest cache and
+    deleted folders are dropped from it. With jobs > 1, README reading and parsing
+    is spread across worker processes and their partial counters are merged.
+    """
     stats = {
         'easy': 0,
         'medium': 0,
@@ -57,44 +172,68 @@ def scan_problems(problems_dir):
         'problems': [],
         'languages': Counter(),
         'tags': Counter(),
-        'recent_problems': []
+        'recent_problems': [],
+        # Inverted indexes built in the same pass: tag / difficulty -> problems (in folder order)
+        'tag_index': defaultdict(list),
+        'difficulty_index': defaultdict(list)
     }
     
     if not os.path.exists(problems_dir):
         return stats
     
     # Scan all problem folders
-    problem_dirs = [d for d in os.listdir(problems_dir) 
-                   if os.path.isdir(os.path.join(problems_dir, d)) and re.match(r'\d{5}-', d)]
+    problem_dirs = sorted(d for d in os.listdir(problems_dir) 
+                          if os.path.isdir(os.path.join(problems_dir, d)) and re.match(r'\d{5}-', d))
     
-    for problem_dir in sorted(problem_dirs):
-        problem_path = os.path.join(problems_dir, problem_dir)
-        readme_file = os.path.join(problem_path, 'README.md')
-        
-        if not os.path.exists(readme_file):
-            continue
+    # One git invocation for the whole tree instead of one per folder
+    commit_dates = get_git_commit_dates(problems_dir)
+    
+    manifest = load_manifest(manifest_path)
+    
+    if jobs > 1 and len(problem_dirs) > 1:
+        # Several chunks per worker keeps the pool balanced when only some READMEs changed
+        chunk_size = max(1, -(-len(problem_dirs) // (jobs * 4)))
+        chunks = [problem_dirs[i:i + chunk_size] for i in range(0, len(problem_dirs), chunk_size)]
+        jobs_args = [(problems_dir, chunk, {d: manifest[d] for d in chunk if d in manifest}) for chunk in chunks]
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            chunk_results = list(executor.map(_scan_chunk_job, jobs_args))
+    else:
+        chunk_results = [scan_chunk(problems_dir, problem_dirs, manifest)]
+    
+    new_manifest = {}
+    rescanned = 0
+    
+    # Chunks preserve folder order, so problems stay sorted by folder
+    for results, languages, tags, errors in chunk_results:
+        stats['languages'] += languages
+        stats['tags'] += tags
+        for error in errors:
+            print(f"⚠️  {error}")
         
-        try:
-            with open(readme_file, 'r', encoding='utf-8') as f:
-                readme_content = f.read()
-            
-            # Parse frontmatter
-            meta_data = parse_frontmatter(readme_content)
+        for problem_dir, meta_data, entry, changed in results:
+            new_manifest[problem_dir] = entry
+            rescanned += changed
             if not meta_data:
                 continue
             
             # Get commit date for this problem folder
-            commit_date = get_git_commit_date(problem_path)
+            commit_date = commit_dates.get(problem_dir)
             
-            problem_info = {
-                'id': meta_data.get('id', 0),
-                'title': meta_data.get('title', ''),
-                'difficulty': meta_data.get('difficulty', 'unknown'),
-                'languages': meta_data.get('languages', []),
-                'tags': meta_data.get('tags', []),
-                'date_solved': commit_date or meta_data.get('date_solved', ''),
-                'folder': problem_dir
-            }
+            try:
+                problem_info = {
+                    'id': meta_data.get('id') or 0,
+                    'title': meta_data.get('title') or '',
+                    'difficulty': str(meta_data.get('difficulty') or 'unknown'),
+                    'languages': list(meta_data.get('languages') or []),
+                    'tags': list(meta_data.get('tags') or []),
+                    'date_solved': commit_date or meta_data.get('date_solved') or '',
+                    'folder': problem_dir
+                }
+                # Surface unhashable tags here rather than halfway through the indexes below
+                dict.fromkeys(problem_info['tags'])
+            except Exception as e:
+                print(f"⚠️  Error reading {os.path.join(problems_dir, problem_dir, 'README.md')}: {e}")
+                continue
             
             stats['problems'].append(problem_info)
             
@@ -102,25 +241,21 @@ def scan_problems(problems_dir):
             difficulty = problem_info['difficulty'].lower()
             if difficulty in ['easy', 'medium', 'hard']:
                 stats[difficulty] += 1
+            stats['difficulty_index'][problem_info['difficulty']].append(problem_info)
             
-            # Count by language
-            for lang in problem_info['languages']:
-                stats['languages'][lang] += 1
-            
-            # Count by tags
-            for tag in problem_info['tags']:
-                if tag not in ['tag1', 'tag2', 'tag3']:  # Filter template tags
-                    stats['tags'][tag] += 1
+            # Index by tags (once per problem even if a tag is listed twice)
+            for tag in dict.fromkeys(problem_info['tags']):
+                stats['tag_index'][tag].append(problem_info)
             
             # Collect recent problems
             if problem_info['date_solved']:
                 stats['recent_problems'].append(problem_info)
-        
-        except Exception as e:
-            print(f"⚠️  Error reading {readme_file}: {e}")
-            continue
     
     stats['total'] = len(stats['problems'])
+    stats['rescanned'] = rescanned
+    
+    if manifest_path and new_manifest != manifest:
+        save_manifest(manifest_path, new_manifest)
     
     # Sort recent problems by date
     stats['recent_problems'].sort(key=lambda x: x['date_solved'], reverse=True)
@@ -129,70 +264,137 @@ def scan_problems(problems_dir):
     return stats
 
 
-def generate_index_by_difficulty(stats):
-    """Generate index classified by difficulty"""
-    index_content = "# LeetCode Problem Index - By Difficulty\n\n"
+class ChangedFileWriter:
+    """Buffered text writer that only replaces the target file when its content actually changes
+
+    Output is streamed to a temporary file next to the target while being hashed; on close the
+    hash is compared with the existing file and an identical result leaves the target untouched
+    (same mtime, nothing for git or CI to pick up).
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.changed = False
+        self._hash = hashlib.sha256()
+        self._size = 0
+        self._tmp_path = f"{path}.{os.getpid()}.tmp"
+        self._file = None
+
+    def __enter__(self):
+        self._file = open(self._tmp_path, 'wb', buffering=64 * 1024)
+        return self
+
+    def write(self, text):
+        data = text.encode('utf-8')
+        self._hash.update(data)
+        self._size += len(data)
+        self._file.write(data)
+
+    def __exit__(self, exc_type, exc, tb):
+        self._file.close()
+        if exc_type is None and not _file_matches(self.path, self._size, self._hash.hexdigest()):
+            os.replace(self._tmp_path, self.path)
+            self.changed = True
+        else:
+            os.remove(self._tmp_path)
+        return False
+
+
+def _file_matches(path, size, digest):
+    """Check whether an existing file has exactly the given size and SHA-256"""
+    try:
+        if os.path.getsize(path) != size:
+            return False
+        file_hash = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1024 * 1024), b''):
+                file_hash.update(block)
+        return file_hash.hexdigest() == digest
+    except OSError:
+        return False
+
+
+def write_if_changed(path, content):
+    """Write content to path unless the file already holds exactly that content, return True if written"""
+    with ChangedFileWriter(path) as out:
+        out.write(content)
+    return out.changed
+
+
+def write_index_by_difficulty(stats, out):
+    """Stream the index classified by difficulty into a writer"""
+    out.write("# LeetCode Problem Index - By Difficulty\n\n")
     
     difficulties = ['easy', 'medium', 'hard']
     difficulty_names = {'easy': 'Easy', 'medium': 'Medium', 'hard': 'Hard'}
     difficulty_emojis = {'easy': '✅', 'medium': '🟡', 'hard': '🔴'}
     
     for difficulty in difficulties:
-        problems = [p for p in stats['problems'] if p['difficulty'] == difficulty]
+        problems = stats['difficulty_index'].get(difficulty)
         if not problems:
             continue
         
-        index_content += f"## {difficulty_emojis[difficulty]} {difficulty_names[difficulty]} ({len(problems)} problems)\n\n"
-        index_content += "| ID | Problem | Languages | Tags |\n"
-        index_content += "|------|------|------|------|\n"
+        out.write(f"## {difficulty_emojis[difficulty]} {difficulty_names[difficulty]} ({len(problems)} problems)\n\n")
+        out.write("| ID | Problem | Languages | Tags |\n")
+        out.write("|------|------|------|------|\n")
         
         for problem in sorted(problems, key=lambda x: x['id']):
             languages = ', '.join(problem['languages'])
             tags = ', '.join([tag for tag in problem['tags'] if tag not in ['tag1', 'tag2', 'tag3']])
             folder_link = f"./problems/{problem['folder']}"
             
-            index_content += f"| {problem['id']} | [{problem['title']}]({folder_link}) | {languages} | {tags} |\n"
+            out.write(f"| {problem['id']} | [{problem['title']}]({folder_link}) | {languages} | {tags} |\n")
         
-        index_content += "\n"
-    
-    return index_content
+        out.write("\n")
 
 
-def generate_index_by_tags(stats):
-    """Generate index classified by tags"""
-    if not stats['tags']:
-        return ""
-    
-    index_content = "# LeetCode Problem Index - By Tags\n\n"
+def write_index_by_tags(stats, out):
+    """Stream the index classified by tags into a writer"""
+    out.write("# LeetCode Problem Index - By Tags\n\n")
     
     for tag, count in stats['tags'].most_common():
         if tag in ['tag1', 'tag2', 'tag3']:  # Skip template tags
             continue
         
-        problems = [p for p in stats['problems'] if tag in p['tags']]
+        problems = stats['tag_index'].get(tag)
         if not problems:
             continue
         
-        index_content += f"## {tag} ({count} problems)\n\n"
-        index_content += "| ID | Problem | Difficulty | Languages |\n"
-        index_content += "|------|------|------|------|\n"
+        out.write(f"## {tag} ({count} problems)\n\n")
+        out.write("| ID | Problem | Difficulty | Languages |\n")
+        out.write("|------|------|------|------|\n")
         
         for problem in sorted(problems, key=lambda x: x['id']):
             difficulty_emoji = {'easy': '✅', 'medium': '🟡', 'hard': '🔴'}.get(problem['difficulty'], '❓')
             languages = ', '.join(problem['languages'])
             folder_link = f"./problems/{problem['folder']}"
             
-            index_content += f"| {problem['id']} | [{problem['title']}]({folder_link}) | {difficulty_emoji} {problem['difficulty'].title()} | {languages} |\n"
+            out.write(f"| {problem['id']} | [{problem['title']}]({folder_link}) | {difficulty_emoji} {problem['difficulty'].title()} | {languages} |\n")
         
-        index_content += "\n"
+        out.write("\n")
+
+
+def generate_index_by_difficulty(stats):
+    """Generate index classified by difficulty"""
+    buffer = io.StringIO()
+    write_index_by_difficulty(stats, buffer)
+    return buffer.getvalue()
+
+
+def generate_index_by_tags(stats):
+    """Generate index classified by tags"""
+    if not stats['tags']:
+        return ""
     
-    return index_content
+    buffer = io.StringIO()
+    write_index_by_tags(stats, buffer)
+    return buffer.getvalue()
 
 
 def update_readme(readme_path, stats):
-    """Update statistics in main README.md"""
+    """Update statistics in main README.md, return True if the file changed"""
     if not os.path.exists(readme_path):
-        return
+        return False
     
     with open(readme_path, 'r', encoding='utf-8') as f:
         content = f.read()
@@ -227,8 +429,9 @@ def update_readme(readme_path, stats):
         recent_pattern = r'\n## (最近練習|Recent Practice).*?(?=\n## [^#]|\Z)'
         new_content = re.sub(recent_pattern, recent_section, new_content, flags=re.DOTALL)
     
-    with open(readme_path, 'w', encoding='utf-8') as f:
-        f.write(new_content)
+    if new_content == content:
+        return False
+    return write_if_changed(readme_path, new_content)
 
 
 def main():
@@ -237,8 +440,26 @@ def main():
     problems_dir = os.path.join(project_root, 'problems')
     readme_path = os.path.join(project_root, 'README.md')
     
+    args = sys.argv[1:]
+    
+    # Incremental scan: only changed READMEs are re-read and re-parsed (--no-cache for a full scan)
+    manifest_path = None
+    if '--no-cache' not in args:
+        manifest_path = os.path.join(project_root, '.cache', 'stats-manifest.json')
+    
+    # Parallel scan: --jobs N worker processes (--jobs 0 uses every core)
+    jobs = 1
+    if '--jobs' in args:
+        try:
+            jobs = int(args[args.index('--jobs') + 1])
+        except (IndexError, ValueError):
+            print("❌ --jobs parameter requires an integer")
+            sys.exit(1)
+        if jobs <= 0:
+            jobs = os.cpu_count() or 1
+    
     # Count problems
-    stats = scan_problems(problems_dir)
+    stats = scan_problems(problems_dir, manifest_path, jobs)
     
     # Display statistics
     print("=== LeetCode Practice Statistics ===")
@@ -246,6 +467,7 @@ def main():
     print(f"Medium: {stats['medium']}")
     print(f"Hard: {stats['hard']}")
     print(f"Total: {stats['total']}")
+    print(f"READMEs re-read: {stats['rescanned']}")
     
     if stats['languages']:
         print(f"\nLanguage stats: {dict(stats['languages'])}")
@@ -254,9 +476,11 @@ def main():
         top_tags = dict(stats['tags'].most_common(5))
         print(f"Popular tags: {top_tags}")
     
-    # Update README
-    update_readme(readme_path, stats)
-    print(f"\n✅ README.md updated!")
+    # Update README (unchanged files are never rewritten, so their mtimes and git status stay put)
+    if update_readme(readme_path, stats):
+        print(f"\n✅ README.md updated!")
+    else:
+        print(f"\n⏭️  README.md unchanged")
     
     # Generate index files
     index_dir = os.path.join(project_root, 'docs')
@@ -264,17 +488,15 @@ def main():
         os.makedirs(index_dir)
     
     # Index by difficulty
-    difficulty_index = generate_index_by_difficulty(stats)
-    with open(os.path.join(index_dir, 'index-by-difficulty.md'), 'w', encoding='utf-8') as f:
-        f.write(difficulty_index)
-    print("✅ Generated index by difficulty")
+    with ChangedFileWriter(os.path.join(index_dir, 'index-by-difficulty.md')) as out:
+        write_index_by_difficulty(stats, out)
+    print("✅ Generated index by difficulty" if out.changed else "⏭️  Index by difficulty unchanged")
     
     # Index by tags
-    tags_index = generate_index_by_tags(stats)
-    if tags_index:
-        with open(os.path.join(index_dir, 'index-by-tags.md'), 'w', encoding='utf-8') as f:
-            f.write(tags_index)
-        print("✅ Generated index by tags")
+    if stats['tags']:
+        with ChangedFileWriter(os.path.join(index_dir, 'index-by-tags.md')) as out:
+            write_index_by_tags(stats, out)
+        print("✅ Generated index by tags" if out.changed else "⏭️  Index by tags unchanged")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Binary test-vector corpus: large inputs stored under problems/*/vectors/ instead of in source code
+Vectors hold a small header plus raw int64 / UTF-8 payloads and are memory-mapped on load, so a
+100M-element input opens instantly and reaches solutions as zero-copy memoryview('q') arguments
+
+Usage: python scripts/vectors.py generate <problem> --size N [--seed N] [--name NAME]
+       python scripts/vectors.py list [problem ...]
+Example: python scripts/vectors.py generate 283 --size 10000000   # -> vectors/n10000000-seed0.vec
+Example: python scripts/vectors.py list
+Example: python scripts/stress.py 283                             # runs every variant on the stored vectors
+
+Inputs come from the problem's generate_input(n, rng); the same size and seed always produce the
+same file, so vectors are regenerated rather than committed (problems/*/vectors/ is gitignored).
+"""
+
+import os
+import sys
+import time
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from lc_utils import (
+    PROJECT_ROOT, VECTOR_DIR, VECTOR_SUFFIX, discover_solution_files, get_input_generator,
+    get_test_vectors, write_test_vector, option_value, TestVector,
+)
+
+
+def generate_vector(path, size, seed=0, name=None):
+    """Generate one input with the problem's generate_input and store it; return the vector path"""
+    generator = get_input_generator(path)
+    if generator is None:
+        raise ValueError(f"{os.path.basename(os.path.dirname(path))} has no generate_input(n, rng)")
+
+    name = name or f"n{size}-seed{seed}"
+    vector_path = os.path.join(os.path.dirname(path), VECTOR_DIR, name + VECTOR_SUFFIX)
+    args = generator(size, random.Random(seed))
+    write_test_vector(vector_path, args, size=size, seed=seed)
+    return vector_path
+
+
+def describe_vector(vector_path):
+    """One line: file size, recorded size / seed and argument shapes"""
+    with TestVector(vector_path) as vector:
+        shapes = [
+            f"int64[{len(arg):,}]" if isinstance(arg, memoryview)
+            else f"str[{len(arg):,}]" if isinstance(arg, str) else repr(arg)
+            for arg in vector.args
+        ]
+        size, seed = vector.size, vector.seed
+    megabytes = os.path.getsize(vector_path) / 2 ** 20
+    return f"{os.path.basename(vector_path):<28} {megabytes:9.1f} MiB   n = {size:,}, seed {seed}   ({', '.join(shapes)})"
+
+
+def main():
+    """Main function"""
+    args = sys.argv[1:]
+    if not args or args[0] not in ('generate', 'list'):
+        print("Usage: python scripts/vectors.py generate <problem> --size N [--seed N] [--name NAME]")
+        print("       python scripts/vectors.py list [problem ...]")
+        sys.exit(1)
+    command = args.pop(0)
+
+    if command == 'generate':
+        size = option_value(args, '--size', int, None)
+        seed = option_value(args, '--seed', int, 0)
+        name = option_value(args, '--name', str, None)
+        filters = [arg for arg in args if not arg.startswith('-')]
+        if size is None or len(filters) != 1:
+            print("❌ generate needs exactly one problem and --size N")
+            sys.exit(1)
+
+        files = discover_solution_files(filters=filters)
+        if not files:
+            print("❌ No solution files found")
+            sys.exit(1)
+        start = time.perf_counter()
+        try:
+            vector_path = generate_vector(files[0], size, seed, name)
+        except (ValueError, TypeError) as e:
+            print(f"❌ {e}")
+            sys.exit(1)
+        print(f"💾 {os.path.relpath(vector_path, PROJECT_ROOT)} ({time.perf_counter() - start:.1f} s)")
+        print(f"   {describe_vector(vector_path)}")
+        return
+
+    filters = [arg for arg in args if not arg.startswith('-')]
+    problem_dirs = dict.fromkeys(os.path.dirname(path) for path in discover_solution_files(filters=filters))
+    found = False
+    for problem_dir in problem_dirs:
+        vector_paths = get_test_vectors(os.path.join(problem_dir, 'solution-python.py'))
+        if not vector_paths:
+            continue
+        found = True
+        print(f"\n💾 {os.path.basename(problem_dir)}")
+        for vector_path in vector_paths:
+            try:
+                print(f"   {describe_vector(vector_path)}")
+            except (OSError, ValueError) as e:
+                print(f"   ❌ {os.path.basename(vector_path)}: {e}")
+    if not found:
+        print("No test vectors yet: python scripts/vectors.py generate <problem> --size N")
+
+
+if __name__ == "__main__":
+    main()
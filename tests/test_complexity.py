@@ -0,0 +1,80 @@
+"""
+Tests for the static complexity analyzer in lc_utils (python -m pytest tests)
+"""
+
+import os
+import sys
+import json
+from functools import cache, lru_cache
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import lc_utils
+from lc_utils import analyze_complexity
+
+
+class ClimbStairs:
+    def plain(self, n):
+        if n <= 1:
+            return 1
+        return self.plain(n - 1) + self.plain(n - 2)
+
+    @lru_cache(maxsize=None)
+    def memoized(self, n):
+        if n <= 1:
+            return 1
+        return self.memoized(n - 1) + self.memoized(n - 2)
+
+    @cache
+    def cached(self, n):
+        if n <= 1:
+            return 1
+        return self.cached(n - 1) + self.cached(n - 2)
+
+
+@pytest.fixture(autouse=True)
+def analysis_cache(tmp_path, monkeypatch):
+    """Keep the on-disk memo out of the checkout"""
+    monkeypatch.setattr(lc_utils, 'ANALYSIS_CACHE_FILE', str(tmp_path / 'complexity-cache.json'))
+    monkeypatch.setattr(lc_utils, '_analysis_cache', None)
+    monkeypatch.setattr(lc_utils, '_pending_analysis', {})
+
+
+def test_plain_two_branch_recursion_is_exponential():
+    assert analyze_complexity(ClimbStairs().plain)[0] == 'O(2^n)'
+
+
+@pytest.mark.parametrize('name', ['memoized', 'cached'])
+def test_memoized_methods_are_unwrapped(name):
+    assert analyze_complexity(getattr(ClimbStairs(), name)) == ('O(n)', 'O(n)')
+
+
+def test_results_are_written_once_per_flush():
+    solution = ClimbStairs()
+    analyze_complexity(solution.memoized)
+    analyze_complexity(solution.cached)
+    assert not os.path.exists(lc_utils.ANALYSIS_CACHE_FILE)
+
+    lc_utils.flush_analysis_cache()
+    with open(lc_utils.ANALYSIS_CACHE_FILE, encoding='utf-8') as f:
+        assert len(json.load(f)) == 2
+
+
+def test_memo_key_covers_the_class_not_the_file():
+    lines = [
+        'import heapq\n',
+        'class Solution:\n',
+        '    def solve(self, nums):\n',
+        '        return self.helper(nums)\n',
+        '\n',
+        '    def helper(self, nums):\n',
+        '        return sorted(nums)\n',
+        '\n',
+        'def test_solution():\n',
+        '    pass\n',
+    ]
+    block = lc_utils._analyzed_source(lines, 'Solution.solve', 3)
+    assert block == ''.join(lines[1:7])
+    edited = lines[:-1] + ['    assert True\n']
+    assert lc_utils._analyzed_source(edited, 'Solution.solve', 3) == block
@@ -0,0 +1,56 @@
+"""
+Tests for scripts/stress.py (python -m pytest tests)
+"""
+
+import os
+import sys
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from lc_utils import discover_solution_files, load_script
+
+stress = load_script('stress')
+
+# 1470. Shuffle the Array: indexing ties len(nums) to 2 * n, the oracle's zip does not
+PRIMARY = '''
+class Solution:
+    def shuffle(self, nums, n):
+        return [nums[i + half * n] for i in range(n) for half in (0, 1)]
+
+
+def brute_force(nums, n):
+    return [x for pair in zip(nums[:n], nums[n:]) for x in pair]
+'''
+
+BUGGY = '''
+class Solution:
+    def shuffle(self, nums, n):
+        return [8 if nums[i + half * n] == 7 else nums[i + half * n] for i in range(n) for half in (0, 1)]
+'''
+
+
+def generate_input(n, rng):
+    return [rng.randint(1, 9) for _ in range(2 * n)], n
+
+
+def test_shrink_keeps_the_original_discrepancy(tmp_path):
+    problem_dir = tmp_path / '01470-shuffle-the-array'
+    problem_dir.mkdir()
+    (problem_dir / 'solution-python.py').write_text(PRIMARY)
+    (problem_dir / 'alt1_buggy-python.py').write_text(BUGGY)
+    paths = discover_solution_files(str(tmp_path))
+    differential = stress.Differential(paths, stress.get_problem_hook(paths[0], 'brute_force'))
+
+    n = 12
+    args = next(
+        args for args in (generate_input(n, random.Random(seed)) for seed in range(100))
+        if differential.signature(args)
+    )
+    signature = differential.signature(args)
+    assert signature == {('alt1_buggy-python.py', 'ok')}
+
+    nums, half = stress.shrink(args, differential, generate_input, n, min_size=1)
+    assert len(nums) == 2 * half, "shrinking broke the len(nums) == 2 * n invariant"
+    assert 7 in nums
+    assert differential.signature((nums, half)) == signature
+    assert [variant for variant, _, _ in differential.mismatches((nums, half))] == ['alt1_buggy-python.py']
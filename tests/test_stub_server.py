@@ -0,0 +1,61 @@
+"""
+Tests for create.py against scripts/leetcode-stub-server.py replaying tests/fixtures/leetcode (python -m pytest tests)
+"""
+
+import os
+import sys
+import threading
+from http.server import ThreadingHTTPServer
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+from lc_utils import load_module, load_script
+
+RECORDINGS_DIR = os.path.join(ROOT, 'tests', 'fixtures', 'leetcode')
+
+stub = load_script('leetcode-stub-server')
+create = load_module(os.path.join(ROOT, 'create.py'))
+
+
+@pytest.fixture
+def leetcode(tmp_path, monkeypatch):
+    """Point create.py at a stub server replaying the fixture, with its caches in tmp_path"""
+    recordings = stub.load_recordings(RECORDINGS_DIR)
+    catalog = stub.build_catalog(RECORDINGS_DIR, recordings)
+    server = ThreadingHTTPServer(('127.0.0.1', 0), stub.make_handler(recordings, catalog, 0.0, 0.0))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    url = f"http://127.0.0.1:{server.server_port}"
+    cache_dir = str(tmp_path / '.cache')
+    monkeypatch.setattr(create, 'CATALOG_URL', f"{url}/api/problems/all/")
+    monkeypatch.setattr(create, 'GRAPHQL_URL', f"{url}/graphql")
+    monkeypatch.setattr(create, 'CACHE_DIR', cache_dir)
+    monkeypatch.setattr(create, 'CATALOG_FILE', os.path.join(cache_dir, 'problem-catalog.json'))
+    monkeypatch.setattr(create, 'QUESTION_CACHE_DIR', os.path.join(cache_dir, 'questions'))
+    monkeypatch.setattr(create, '_catalog', None)
+    monkeypatch.setattr(create, '_catalog_refreshed', False)
+    yield create
+
+    server.shutdown()
+    server.server_close()
+
+
+def test_catalog_covers_every_recording(leetcode):
+    assert leetcode.load_problem_catalog() == {'1': 'two-sum', '35': 'search-insert-position', '66': 'plus-one'}
+
+
+def test_question_replays_with_examples_and_constraints(leetcode):
+    info = leetcode.get_leetcode_problem_info(35)
+    assert (info['title'], info['difficulty']) == ('Search Insert Position', 'easy')
+    assert leetcode.build_python_test_cases(info['content'], info['metaData'])[0] == (([1, 3, 5, 6], 5), 2)
+    assert leetcode.parse_constraints(info['content'])['nums.length'] == (1, 10000)
+
+
+def test_batch_prefetch_and_unknown_problem(leetcode):
+    infos = leetcode.prefetch_problem_infos([1, 66, 9999])
+    assert infos[1]['titleSlug'] == 'two-sum'
+    assert infos[66]['titleSlug'] == 'plus-one'
+    assert infos[9999] is None
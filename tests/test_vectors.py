@@ -0,0 +1,48 @@
+"""
+Tests for the binary test vectors in lc_utils (python -m pytest tests)
+lc_utils.TestVector is used through the module so pytest does not try to collect it
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import lc_utils
+from lc_utils import write_test_vector, _vector_structs
+
+
+@pytest.fixture
+def vector_path(tmp_path):
+    path = str(tmp_path / 'n3-seed0.vec')
+    write_test_vector(path, ([1, 2, 3], 4, 'ab'), size=3)
+    return path
+
+
+def test_round_trip(vector_path):
+    with lc_utils.TestVector(vector_path) as vector:
+        nums, k, text = vector.args
+        assert (nums.tolist(), k, text, vector.size) == ([1, 2, 3], 4, 'ab', 3)
+
+
+@pytest.mark.parametrize('corrupt, message', [
+    (lambda data, header, entry: data[:header.size - 1], 'truncated header'),
+    (lambda data, header, entry: data[:header.size + 1], 'truncated argument table'),
+    (lambda data, header, entry: data[:-1], 'runs past the end'),
+    (lambda data, header, entry: _patch_offset(data, header, entry, 3), 'not 8-byte aligned'),
+])
+def test_corrupt_files_raise_value_error(vector_path, corrupt, message):
+    header, entry = _vector_structs()
+    with open(vector_path, 'rb') as f:
+        data = bytearray(f.read())
+    with open(vector_path, 'wb') as f:
+        f.write(corrupt(data, header, entry))
+    with pytest.raises(ValueError, match=message):
+        lc_utils.TestVector(vector_path)
+
+
+def _patch_offset(data, header, entry, offset):
+    kind, _, length = entry.unpack_from(data, header.size)
+    entry.pack_into(data, header.size, kind, offset, length)
+    return data